@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import importlib.util
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
 from backend.subtitles.lyric_sync import (
@@ -36,7 +38,31 @@ def ensure_runtime_dependencies() -> None:
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Offline AI Caption Studio")
-    parser.add_argument("video_file", type=Path, help="Input video file path")
+    parser.add_argument(
+        "video_file",
+        type=Path,
+        nargs="*",
+        default=[],
+        help="Input video file path(s) (omit when using --batch)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "Number of parallel ffmpeg audio-extraction workers when "
+            "multiple videos are given. Transcription still runs on a "
+            "single loaded model."
+        ),
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help=(
+            "Read tab-separated 'video_path<TAB>output_path' lines from standard "
+            "input and transcribe them all with a single loaded model."
+        ),
+    )
     parser.add_argument(
         "--model-size",
         default="small",
@@ -49,8 +75,37 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "--compute-type",
-        default="int8",
-        help="faster-whisper compute type, e.g. int8, float16, float32",
+        default="auto",
+        help=(
+            "faster-whisper compute type: auto, int8, int8_float16, "
+            "float16, bfloat16, float32. 'auto' picks the fastest type "
+            "supported by the device."
+        ),
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=16,
+        help="Batched inference size for decoding VAD chunks in parallel.",
+    )
+    parser.add_argument(
+        "--beam-size",
+        type=int,
+        default=5,
+        help="Decoder beam size. 1 enables the fastest greedy decoding.",
+    )
+    parser.add_argument(
+        "--vad-min-silence-ms",
+        type=int,
+        default=None,
+        help="Minimum silence duration (ms) for VAD segmentation.",
+    )
+    parser.add_argument(
+        "--temperature",
+        type=float,
+        nargs="+",
+        default=None,
+        help="Temperature fallback values, e.g. --temperature 0.0 0.2 0.4",
     )
     parser.add_argument(
         "--lyrics-file",
@@ -66,6 +121,12 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+@functools.lru_cache(maxsize=None)
+def _ensure_dir(path: Path) -> None:
+    """Create a directory once per process; repeat calls skip the syscall."""
+    path.mkdir(parents=True, exist_ok=True)
+
+
 def _read_lyrics_text(args: argparse.Namespace) -> str | None:
     if args.lyrics_file and args.lyrics_stdin:
         raise LyricSyncError("Use either --lyrics-file or --lyrics-stdin, not both.")
@@ -81,29 +142,139 @@ def _read_lyrics_text(args: argparse.Namespace) -> str | None:
     return None
 
 
-def run() -> Path:
+def _transcribe_options(args: argparse.Namespace) -> dict:
+    options: dict = {"beam_size": args.beam_size, "batch_size": args.batch_size}
+    if args.vad_min_silence_ms is not None:
+        options["vad_parameters"] = {"min_silence_duration_ms": args.vad_min_silence_ms}
+    if args.temperature is not None:
+        options["temperature"] = args.temperature
+    return options
+
+
+def _transcribe_to_srt(
+    transcriber: WhisperTranscriber,
+    video_file: Path,
+    output_path: Path,
+    language: str | None,
+    transcribe_options: dict,
+) -> Path:
+    audio_path = TEMP_DIR / f"{video_file.stem}.wav"
+    extract_audio(video_file, audio_path)
+    segments = transcriber.transcribe(audio_path, language=language, **transcribe_options)
+    return write_srt(segments, output_path)
+
+
+def _run_batch(
+    transcriber: WhisperTranscriber,
+    language: str | None,
+    transcribe_options: dict,
+) -> None:
+    """Transcribe 'video<TAB>output' lines from stdin with one loaded model.
+
+    Model load takes hundreds of milliseconds, so reusing a single model
+    across a batch beats spawning one process per video. Results are
+    reported one line per input: 'OK<TAB>output' or 'ERR<TAB>video<TAB>message'.
+    """
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+
+        video_raw, sep, output_raw = line.partition("\t")
+        video_file = Path(video_raw)
+        output_path = Path(output_raw) if sep and output_raw else OUTPUT_DIR / f"{video_file.stem}.srt"
+
+        try:
+            result = _transcribe_to_srt(
+                transcriber, video_file, output_path, language, transcribe_options
+            )
+        except (AudioExtractionError, TranscriptionError) as exc:
+            message = str(exc).replace("\n", " ")
+            print(f"ERR\t{video_file}\t{message}", flush=True)
+        else:
+            print(f"OK\t{result}", flush=True)
+
+
+def _run_parallel(
+    transcriber: WhisperTranscriber,
+    videos: list[Path],
+    language: str | None,
+    transcribe_options: dict,
+    jobs: int,
+) -> None:
+    """Overlap per-file ffmpeg extraction with single-model transcription.
+
+    Audio extraction is independent per file and CPU/I-O bound, so it
+    runs in a process pool while the one loaded model transcribes
+    results as they complete. Reporting matches --batch mode.
+    """
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {
+            pool.submit(extract_audio, video, TEMP_DIR / f"{video.stem}.wav"): video
+            for video in videos
+        }
+        for future in as_completed(futures):
+            video = futures[future]
+            try:
+                audio_path = future.result()
+                segments = transcriber.transcribe(
+                    audio_path, language=language, **transcribe_options
+                )
+                result = write_srt(segments, OUTPUT_DIR / f"{video.stem}.srt")
+            except (AudioExtractionError, TranscriptionError) as exc:
+                message = str(exc).replace("\n", " ")
+                print(f"ERR\t{video}\t{message}", flush=True)
+            else:
+                print(f"OK\t{result}", flush=True)
+
+
+def run() -> Path | None:
     args = parse_args()
     try:
         ensure_runtime_dependencies()
     except RuntimeDependencyError as exc:
         raise SystemExit(str(exc)) from exc
 
-    TEMP_DIR.mkdir(parents=True, exist_ok=True)
-    MODELS_DIR.mkdir(parents=True, exist_ok=True)
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    if not args.batch and not args.video_file:
+        raise SystemExit("A video file path is required unless --batch is used.")
+    if args.batch and (args.lyrics_file or args.lyrics_stdin):
+        raise SystemExit("Lyrics synchronization is not supported in --batch mode.")
+    if len(args.video_file) > 1 and (args.lyrics_file or args.lyrics_stdin):
+        raise SystemExit("Lyrics synchronization requires a single video file.")
 
-    output_path = OUTPUT_DIR / f"{args.video_file.stem}.srt"
-    audio_path = TEMP_DIR / f"{args.video_file.stem}.wav"
+    _ensure_dir(TEMP_DIR)
+    _ensure_dir(MODELS_DIR)
+    _ensure_dir(OUTPUT_DIR)
 
     try:
-        extract_audio(args.video_file, audio_path)
-
         transcriber = WhisperTranscriber(
             model_size=args.model_size,
             model_dir=MODELS_DIR,
             compute_type=args.compute_type,
         )
-        segments = transcriber.transcribe(audio_path, language=args.language)
+
+        if args.batch:
+            _run_batch(transcriber, args.language, _transcribe_options(args))
+            return None
+
+        if len(args.video_file) > 1:
+            _run_parallel(
+                transcriber,
+                args.video_file,
+                args.language,
+                _transcribe_options(args),
+                args.jobs,
+            )
+            return None
+
+        video_file = args.video_file[0]
+        output_path = OUTPUT_DIR / f"{video_file.stem}.srt"
+        audio_path = TEMP_DIR / f"{video_file.stem}.wav"
+
+        extract_audio(video_file, audio_path)
+        segments = transcriber.transcribe(
+            audio_path, language=args.language, **_transcribe_options(args)
+        )
 
         lyrics_text = _read_lyrics_text(args)
         if lyrics_text is not None:
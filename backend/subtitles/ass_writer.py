@@ -1,21 +1,24 @@
 from __future__ import annotations
 
+import re
 from pathlib import Path
 from typing import Iterable
 
 from backend.caption_segment import CaptionSegment
 
+_ASS_ESCAPE_RE = re.compile(r"([\\{}])")
+
 
 def _to_ass_time(seconds: float) -> str:
-    centiseconds = int(round(seconds * 100))
+    centiseconds = int(seconds * 100 + 0.5)
     hours, rem = divmod(centiseconds, 360000)
     minutes, rem = divmod(rem, 6000)
     secs, cs = divmod(rem, 100)
-    return f"{hours}:{minutes:02}:{secs:02}.{cs:02}"
+    return "%d:%02d:%02d.%02d" % (hours, minutes, secs, cs)
 
 
 def _escape_ass_text(text: str) -> str:
-    return text.replace("\\", r"\\").replace("{", r"\{").replace("}", r"\}")
+    return _ASS_ESCAPE_RE.sub(r"\\\1", text)
 
 
 def write_ass(segments: Iterable[CaptionSegment], output_path: Path) -> Path:
@@ -37,15 +40,17 @@ Style: Default,Arial,44,&H00FFFFFF,&H000000FF,&H00111111,&H66000000,0,0,0,0,100,
 Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
 """
 
-    lines = [header]
-    for segment in segments:
-        lines.append(
-            "Dialogue: 0,"
-            f"{_to_ass_time(segment.start)},"
-            f"{_to_ass_time(segment.end)},"
-            "Default,,0,0,0,,"
-            f"{_escape_ass_text(segment.text)}"
-        )
-
-    output_path.write_text("\n".join(lines), encoding="utf-8")
+    with output_path.open("w", encoding="utf-8") as handle:
+        handle.write(header)
+        handle.write("\n")
+        for segment in segments:
+            handle.write(
+                "Dialogue: 0,"
+                + _to_ass_time(segment.start)
+                + ","
+                + _to_ass_time(segment.end)
+                + ",Default,,0,0,0,,"
+                + _escape_ass_text(segment.text)
+                + "\n"
+            )
     return output_path
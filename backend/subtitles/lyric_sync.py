@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import re
-from difflib import SequenceMatcher
+from bisect import bisect_left
+from collections import defaultdict
 from typing import Iterable
 
+from rapidfuzz import fuzz, process
+
 from backend.caption_segment import CaptionSegment
 
 
@@ -11,9 +14,11 @@ class LyricSyncError(RuntimeError):
     """Raised when lyric synchronization input is invalid."""
 
 
+_NON_WORD_RE = re.compile(r"[^\w]+")
+
+
 def _normalize(text: str) -> str:
-    lowered = text.lower().strip()
-    return re.sub(r"\s+", " ", re.sub(r"[^\w\s]", " ", lowered)).strip()
+    return _NON_WORD_RE.sub(" ", text.lower()).strip()
 
 
 def parse_lyrics_lines(raw_lyrics: str) -> list[str]:
@@ -35,6 +40,12 @@ def sync_segments_to_lyrics(
     A greedy forward-only search prevents line reordering in final synced lyrics.
     """
     synced: list[CaptionSegment] = []
+    normalized_lyrics = [_normalize(line) for line in lyrics_lines]
+
+    lyric_norm_to_indices: dict[str, list[int]] = defaultdict(list)
+    for idx, norm in enumerate(normalized_lyrics):
+        lyric_norm_to_indices[norm].append(idx)
+
     lyric_idx = 0
 
     for segment in segments:
@@ -45,20 +56,36 @@ def sync_segments_to_lyrics(
         if not segment_norm:
             continue
 
-        best_idx = lyric_idx
-        best_score = -1.0
-
         search_end = min(len(lyrics_lines), lyric_idx + 6)
-        for idx in range(lyric_idx, search_end):
-            score = SequenceMatcher(None, segment_norm, _normalize(lyrics_lines[idx])).ratio()
-            if score > best_score:
-                best_score = score
-                best_idx = idx
 
-        if best_score < min_similarity:
+        # Exact matches are the common case for well-aligned inputs, so
+        # resolve them with a hash lookup over the candidate window and
+        # only fall through to the fuzzy scorer when nothing is verbatim.
+        exact_indices = lyric_norm_to_indices.get(segment_norm)
+        if exact_indices:
+            pos = bisect_left(exact_indices, lyric_idx)
+            if pos < len(exact_indices) and exact_indices[pos] < search_end:
+                exact_idx = exact_indices[pos]
+                synced.append(
+                    CaptionSegment(start=segment.start, end=segment.end, text=lyrics_lines[exact_idx])
+                )
+                lyric_idx = exact_idx + 1
+                continue
+        # score_cutoff lets rapidfuzz discard candidates from cheap C-level
+        # length bounds before running the full scorer, so no Python-side
+        # quick-ratio prefilter is needed here.
+        match = process.extractOne(
+            segment_norm,
+            normalized_lyrics[lyric_idx:search_end],
+            scorer=fuzz.ratio,
+            score_cutoff=min_similarity * 100,
+        )
+
+        if match is None:
             chosen_text = lyrics_lines[lyric_idx]
             lyric_idx += 1
         else:
+            best_idx = lyric_idx + match[2]
             chosen_text = lyrics_lines[best_idx]
             lyric_idx = best_idx + 1
 
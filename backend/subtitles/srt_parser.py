@@ -2,50 +2,41 @@ from __future__ import annotations
 
 import re
 from pathlib import Path
+from typing import Iterator
 
 from backend.caption_segment import CaptionSegment
 
-_TIME_RE = re.compile(
-    r"(?P<h>\d{2}):(?P<m>\d{2}):(?P<s>\d{2}),(?P<ms>\d{3})"
+# One block per match: index line, timing line, then text up to a blank line.
+_BLOCK_RE = re.compile(
+    r"^\s*\d+\s*\n"
+    r"(\d{2}):(\d{2}):(\d{2}),(\d{3})\s*-->\s*"
+    r"(\d{2}):(\d{2}):(\d{2}),(\d{3})[^\n]*\n"
+    r"(.*?)(?=\n\s*\n|\Z)",
+    re.MULTILINE | re.DOTALL,
 )
 
 
-def _to_seconds(timestamp: str) -> float:
-    match = _TIME_RE.fullmatch(timestamp.strip())
-    if match is None:
-        raise ValueError(f"Invalid SRT timestamp: {timestamp}")
+def iter_srt_file(path: Path) -> Iterator[CaptionSegment]:
+    """Yield segments one at a time instead of materializing the list.
 
-    hours = int(match.group("h"))
-    minutes = int(match.group("m"))
-    seconds = int(match.group("s"))
-    millis = int(match.group("ms"))
-    return hours * 3600 + minutes * 60 + seconds + millis / 1000
-
-
-def parse_srt_file(path: Path) -> list[CaptionSegment]:
+    Lets callers fold the parse into their own pass (sorting, filtering)
+    without holding a second full copy of a large file's segments.
+    """
     text = path.read_text(encoding="utf-8")
-    blocks = [block.strip() for block in re.split(r"\n\s*\n", text) if block.strip()]
-
-    segments: list[CaptionSegment] = []
-    for block in blocks:
-        lines = [line.rstrip() for line in block.splitlines() if line.strip()]
-        if len(lines) < 2:
-            continue
 
-        if "-->" not in lines[1]:
-            continue
+    for match in _BLOCK_RE.finditer(text):
+        s_h, s_m, s_s, s_ms, e_h, e_m, e_s, e_ms, body = match.groups()
 
-        start_raw, end_raw = [part.strip() for part in lines[1].split("-->", maxsplit=1)]
-        caption_text = " ".join(lines[2:]).strip()
+        caption_text = " ".join(line.strip() for line in body.splitlines() if line.strip())
         if not caption_text:
             continue
 
-        segments.append(
-            CaptionSegment(
-                start=_to_seconds(start_raw),
-                end=_to_seconds(end_raw),
-                text=caption_text,
-            )
+        yield CaptionSegment(
+            start=int(s_h) * 3600 + int(s_m) * 60 + int(s_s) + int(s_ms) / 1000,
+            end=int(e_h) * 3600 + int(e_m) * 60 + int(e_s) + int(e_ms) / 1000,
+            text=caption_text,
         )
 
-    return segments
+
+def parse_srt_file(path: Path) -> list[CaptionSegment]:
+    return list(iter_srt_file(path))
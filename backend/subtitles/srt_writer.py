@@ -7,26 +7,21 @@ from backend.caption_segment import CaptionSegment
 
 
 def _to_srt_time(seconds: float) -> str:
-    milliseconds = int(round(seconds * 1000))
+    milliseconds = int(seconds * 1000 + 0.5)
     hours, rem = divmod(milliseconds, 3_600_000)
     minutes, rem = divmod(rem, 60_000)
     secs, millis = divmod(rem, 1000)
-    return f"{hours:02}:{minutes:02}:{secs:02},{millis:03}"
+    # %-formatting beats f-strings for fixed zero-padded numeric fields.
+    return "%02d:%02d:%02d,%03d" % (hours, minutes, secs, millis)
 
 
 def write_srt(segments: Iterable[CaptionSegment], output_path: Path) -> Path:
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    lines: list[str] = []
-    for index, segment in enumerate(segments, start=1):
-        lines.extend(
-            [
-                str(index),
-                f"{_to_srt_time(segment.start)} --> {_to_srt_time(segment.end)}",
-                segment.text,
-                "",
-            ]
+    fmt = _to_srt_time
+    with output_path.open("w", encoding="utf-8") as handle:
+        handle.writelines(
+            f"{index}\n{fmt(segment.start)} --> {fmt(segment.end)}\n{segment.text}\n\n"
+            for index, segment in enumerate(segments, start=1)
         )
-
-    output_path.write_text("\n".join(lines), encoding="utf-8")
     return output_path
@@ -1,63 +1,105 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import importlib.util
+import json
 import os
+import re
+import shlex
 import shutil
 import subprocess
 import sys
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Final, Iterable
 
+_IS_MACOS: Final[bool] = sys.platform == "darwin"
 
-def _resolve_pyqt_plugins_path() -> Path | None:
-    spec = importlib.util.find_spec("PyQt6")
-    if spec is None or spec.origin is None:
-        return None
 
-    plugins_path = Path(spec.origin).resolve().parent / "Qt6" / "plugins"
+@functools.lru_cache(maxsize=1)
+def _resolve_pyqt_plugins_path() -> Path | None:
+    # If PyQt6 is already imported, its __file__ answers directly; the
+    # find_spec fallback walks every sys.path importer, which is slow on
+    # long paths and never changes for the life of the process.
+    module = sys.modules.get("PyQt6")
+    origin = getattr(module, "__file__", None)
+    if origin is None:
+        spec = importlib.util.find_spec("PyQt6")
+        if spec is None or spec.origin is None:
+            return None
+        origin = spec.origin
+
+    plugins_path = Path(origin).resolve().parent / "Qt6" / "plugins"
     if plugins_path.exists():
         return plugins_path
     return None
 
 
 def _configure_qt_runtime_environment() -> None:
-    logging_rules = os.environ.get("QT_LOGGING_RULES", "")
+    environ = os.environ
+    logging_rules = environ.get("QT_LOGGING_RULES", "")
     if "qt.qpa.fonts.warning" not in logging_rules:
         if logging_rules:
-            os.environ["QT_LOGGING_RULES"] = f"{logging_rules};qt.qpa.fonts.warning=false"
+            environ["QT_LOGGING_RULES"] = f"{logging_rules};qt.qpa.fonts.warning=false"
         else:
-            os.environ["QT_LOGGING_RULES"] = "qt.qpa.fonts.warning=false"
-
-    if sys.platform != "darwin":
+            environ["QT_LOGGING_RULES"] = "qt.qpa.fonts.warning=false"
+
+    if sys.platform.startswith("linux"):
+        # GStreamer picks up VA-API/VDPAU hardware decode where available;
+        # Qt's bundled ffmpeg backend decodes in software and stutters on
+        # high-bitrate sources. OpenGL RHI keeps the video sink on a path
+        # that accepts hardware-decoded frames.
+        environ.setdefault("QT_MEDIA_BACKEND", "gstreamer")
+        environ.setdefault("QSG_RHI_BACKEND", "opengl")
+    elif sys.platform == "win32":
+        # The Windows backend uses Media Foundation with hardware decode.
+        environ.setdefault("QT_MEDIA_BACKEND", "windows")
+
+    if not _IS_MACOS:
         return
 
     # macOS native backend is more reliable than Qt's ffmpeg backend in venv installs.
-    os.environ.setdefault("QT_MEDIA_BACKEND", "darwin")
+    environ.setdefault("QT_MEDIA_BACKEND", "darwin")
 
     plugins_path = _resolve_pyqt_plugins_path()
     if plugins_path is None:
         return
 
-    existing = os.environ.get("QT_PLUGIN_PATH")
+    existing = environ.get("QT_PLUGIN_PATH")
     if not existing:
-        os.environ["QT_PLUGIN_PATH"] = str(plugins_path)
+        environ["QT_PLUGIN_PATH"] = str(plugins_path)
         return
 
-    existing_paths = existing.split(os.pathsep)
-    if str(plugins_path) not in existing_paths:
-        os.environ["QT_PLUGIN_PATH"] = os.pathsep.join([str(plugins_path), existing])
-
-
-_configure_qt_runtime_environment()
-
+    pathsep = os.pathsep
+    if str(plugins_path) not in existing.split(pathsep):
+        environ["QT_PLUGIN_PATH"] = pathsep.join([str(plugins_path), existing])
+
+
+from PyQt6.QtCore import (
+    QLibraryInfo,
+    QObject,
+    QPointF,
+    QProcess,
+    QRectF,
+    QRunnable,
+    Qt,
+    QThreadPool,
+    QTimer,
+    QUrl,
+    pyqtSignal,
+)
+from PyQt6.QtGui import QAction, QBrush, QColor, QFont, QPen, QStaticText
 
-from PyQt6.QtCore import QLibraryInfo, QPointF, QRectF, Qt, QUrl, pyqtSignal
-from PyQt6.QtGui import QAction, QBrush, QColor, QFont, QPen
-from PyQt6.QtMultimedia import QAudioOutput, QMediaFormat, QMediaPlayer
-from PyQt6.QtMultimediaWidgets import QVideoWidget
+# QtMultimedia and QtMultimediaWidgets load the media plugin stack
+# (tens of MB); they are imported inside the methods that need them so
+# importing this module for its helpers stays cheap. QtCore/QtGui/
+# QtWidgets stay top-level: every class below subclasses them, and
+# hiding that behind a factory is not worth the readability cost.
 from PyQt6.QtWidgets import (
     QApplication,
+    QCheckBox,
     QComboBox,
     QDoubleSpinBox,
     QFileDialog,
@@ -71,7 +113,6 @@ from PyQt6.QtWidgets import (
     QLabel,
     QLineEdit,
     QListWidget,
-    QListWidgetItem,
     QMainWindow,
     QMessageBox,
     QPlainTextEdit,
@@ -88,80 +129,245 @@ from PyQt6.QtWidgets import (
 from backend.caption_segment import CaptionSegment
 from backend.subtitles.ass_writer import write_ass
 from backend.subtitles.lyric_sync import LyricSyncError, parse_lyrics_lines, sync_segments_to_lyrics
-from backend.subtitles.srt_parser import parse_srt_file
+from backend.subtitles.srt_parser import iter_srt_file, parse_srt_file
 from backend.subtitles.srt_writer import write_srt
 
 
-PROJECT_ROOT = Path(__file__).resolve().parents[2]
-OUTPUT_DIR = PROJECT_ROOT / "output"
-TEMP_DIR = PROJECT_ROOT / "temp"
+# Resolved lazily: .resolve() chases symlinks with a chain of syscalls,
+# which worker imports and --help invocations should not pay at import time.
+@functools.cache
+def _project_root() -> Path:
+    return Path(__file__).resolve().parents[2]
+
+
+@functools.cache
+def _output_dir() -> Path:
+    return _project_root() / "output"
+
+
+@functools.cache
+def _temp_dir() -> Path:
+    return _project_root() / "temp"
+
+
+# Static text built once; _multimedia_troubleshooting_message only fills
+# in the placeholders, so media-error handlers on the event thread do no
+# list building.
+_TROUBLESHOOTING_TEMPLATE = "\n".join(
+    [
+        "{detail}QtMultimedia backend failed to initialize.",
+        "QT_MEDIA_BACKEND={backend}",
+        "QT_PLUGIN_PATH={plugin_path}",
+        "Qt plugins path={qt_plugins}",
+        "",
+        "Recommended fixes:",
+        "1) Recreate the venv with Python 3.10+ using ./scripts/setup.sh",
+        "2) Remove conflicting shell vars: QT_PLUGIN_PATH and QT_QPA_PLATFORM_PLUGIN_PATH",
+        "3) On macOS, use the native backend: export QT_MEDIA_BACKEND=darwin",
+        "4) For caption burn-in export on macOS, install ffmpeg-full and set FFMPEG_BIN",
+    ]
+)
+
+
+@functools.cache
+def _qt_plugins_path() -> str:
+    # QLibraryInfo walks Qt's install layout on every call; the answer
+    # never changes within a process.
+    return QLibraryInfo.path(QLibraryInfo.LibraryPath.PluginsPath)
 
 
 def _multimedia_troubleshooting_message(error_detail: str | None = None) -> str:
-    lines = []
-    if error_detail:
-        lines.append(error_detail)
-    lines.extend(
-        [
-            "QtMultimedia backend failed to initialize.",
-            f"QT_MEDIA_BACKEND={os.environ.get('QT_MEDIA_BACKEND', '(unset)')}",
-            f"QT_PLUGIN_PATH={os.environ.get('QT_PLUGIN_PATH', '(unset)')}",
-            f"Qt plugins path={QLibraryInfo.path(QLibraryInfo.LibraryPath.PluginsPath)}",
-            "",
-            "Recommended fixes:",
-            "1) Recreate the venv with Python 3.10+ using ./scripts/setup.sh",
-            "2) Remove conflicting shell vars: QT_PLUGIN_PATH and QT_QPA_PLATFORM_PLUGIN_PATH",
-            "3) On macOS, use the native backend: export QT_MEDIA_BACKEND=darwin",
-            "4) For caption burn-in export on macOS, install ffmpeg-full and set FFMPEG_BIN",
-        ]
+    return _TROUBLESHOOTING_TEMPLATE.format(
+        detail=f"{error_detail}\n" if error_detail else "",
+        backend=os.environ.get("QT_MEDIA_BACKEND", "(unset)"),
+        plugin_path=os.environ.get("QT_PLUGIN_PATH", "(unset)"),
+        qt_plugins=_qt_plugins_path(),
     )
-    return "\n".join(lines)
+
+
+_multimedia_validation_done = False
+_multimedia_validation_result: str | None = None
 
 
 def _validate_multimedia_backend() -> str | None:
+    """Probe the media plugin registry once per process.
+
+    The first supportedFileFormats call loads every media plugin, which
+    can take hundreds of milliseconds; repeat callers get the cached
+    verdict.
+    """
+    global _multimedia_validation_done, _multimedia_validation_result
+    if _multimedia_validation_done:
+        return _multimedia_validation_result
+
+    from PyQt6.QtMultimedia import QMediaFormat
+
     try:
         decode_formats = QMediaFormat().supportedFileFormats(QMediaFormat.ConversionMode.Decode)
     except Exception as exc:  # noqa: BLE001 - surface Qt runtime failures to the user
-        return _multimedia_troubleshooting_message(f"QtMultimedia probe error: {exc}")
+        result = _multimedia_troubleshooting_message(f"QtMultimedia probe error: {exc}")
+    else:
+        result = None if decode_formats else _multimedia_troubleshooting_message()
+
+    _multimedia_validation_done = True
+    _multimedia_validation_result = result
+    return result
+
+
+_SUBTITLE_ESCAPE_TABLE = str.maketrans(
+    {
+        "\\": r"\\",
+        ":": r"\:",
+        "'": r"\'",
+        " ": r"\ ",
+        "[": r"\[",
+        "]": r"\]",
+        ",": r"\,",
+    }
+)
 
-    if decode_formats:
-        return None
 
-    return _multimedia_troubleshooting_message()
+def _escape_subtitle_filter_path(path: Path) -> str:
+    return path.as_posix().translate(_SUBTITLE_ESCAPE_TABLE)
+
 
+def _format_command(command: Iterable[str]) -> str:
+    """Quote a command for error dialogs so it can be copy-pasted and rerun."""
+    if os.name == "nt":
+        return subprocess.list2cmdline(command)
+    return shlex.join(command)
 
-def _escape_subtitle_filter_path(path: Path) -> str:
-    value = path.as_posix()
-    value = value.replace("\\", r"\\")
-    value = value.replace(":", r"\:")
-    value = value.replace("'", r"\'")
-    value = value.replace(" ", r"\ ")
-    value = value.replace("[", r"\[")
-    value = value.replace("]", r"\]")
-    value = value.replace(",", r"\,")
-    return value
-
-
-def _ffmpeg_has_subtitles_filter(ffmpeg_bin: str) -> bool:
+
+def _ffmpeg_caps_cache_path() -> Path:
+    return _temp_dir() / "ffmpeg_caps.json"
+
+
+# ffmpeg prints the filter table to stdout; one row per filter with the
+# capability flags in the first column.
+_SUBTITLES_FILTER_RE = re.compile(rb"(?m)^\s*\S+\s+subtitles\s")
+
+
+def _probe_ffmpeg_subtitles_filter(ffmpeg_bin: str) -> bool:
     try:
         result = subprocess.run(
             [ffmpeg_bin, "-hide_banner", "-filters"],
             capture_output=True,
-            text=True,
             check=False,
         )
     except OSError:
         return False
 
-    output = f"{result.stdout}\n{result.stderr}"
-    for line in output.splitlines():
-        parts = line.split()
-        if len(parts) >= 2 and parts[1] == "subtitles":
-            return True
-    return False
+    return bool(_SUBTITLES_FILTER_RE.search(result.stdout))
+
+
+def _read_ffmpeg_caps_cache() -> dict:
+    try:
+        caps = json.loads(_ffmpeg_caps_cache_path().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return caps if isinstance(caps, dict) else {}
+
+
+def _store_ffmpeg_caps(ffmpeg_bin: str, mtime_ns: int, has_subtitles: bool) -> None:
+    caps = _read_ffmpeg_caps_cache()
+    caps[ffmpeg_bin] = {"mtime_ns": mtime_ns, "has_subtitles": has_subtitles}
+    cache_path = _ffmpeg_caps_cache_path()
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps(caps), encoding="utf-8")
+    except OSError:
+        pass
+
+
+# Video encoder rows in 'ffmpeg -encoders' start with a V flag column.
+_VIDEO_ENCODER_ROW_RE = re.compile(rb"(?m)^\s*V\S{5}\s+(\S+)")
+
+
+@dataclass(frozen=True)
+class _FfmpegCapabilities:
+    has_subtitles: bool
+    encoders: frozenset[str]
+    hwaccels: frozenset[str]
+
+
+def _probe_ffmpeg_listing(ffmpeg_bin: str, flag: str) -> bytes:
+    try:
+        result = subprocess.run(
+            [ffmpeg_bin, "-hide_banner", flag],
+            capture_output=True,
+            check=False,
+        )
+    except OSError:
+        return b""
+    return result.stdout
+
+
+def _probe_ffmpeg_video_encoders(ffmpeg_bin: str) -> frozenset[str]:
+    listing = _probe_ffmpeg_listing(ffmpeg_bin, "-encoders")
+    return frozenset(
+        match.group(1).decode("ascii", "ignore")
+        for match in _VIDEO_ENCODER_ROW_RE.finditer(listing)
+    )
+
+
+def _probe_ffmpeg_hwaccels(ffmpeg_bin: str) -> frozenset[str]:
+    listing = _probe_ffmpeg_listing(ffmpeg_bin, "-hwaccels")
+    names = (line.strip() for line in listing.decode("ascii", "ignore").splitlines()[1:])
+    return frozenset(name for name in names if name)
+
+
+@functools.lru_cache(maxsize=8)
+def _ffmpeg_capabilities(ffmpeg_bin: str, mtime_ns: int) -> _FfmpegCapabilities:
+    return _FfmpegCapabilities(
+        has_subtitles=_ffmpeg_has_subtitles_filter_cached(ffmpeg_bin, mtime_ns),
+        encoders=_probe_ffmpeg_video_encoders(ffmpeg_bin),
+        hwaccels=_probe_ffmpeg_hwaccels(ffmpeg_bin),
+    )
+
+
+def _hw_encoding_args(caps: _FfmpegCapabilities) -> tuple[list[str], list[str]]:
+    """Pick hardware decode/encode flags supported by this ffmpeg build.
+
+    libass still renders subtitles on the CPU, but moving decode and
+    encode to VideoToolbox/NVENC frees the CPU for the filter and is
+    several times faster than software x264 on supported machines.
+    Returns (input_args, output_args); both empty means software encode.
+    """
+    if _IS_MACOS:
+        if "h264_videotoolbox" in caps.encoders and "videotoolbox" in caps.hwaccels:
+            return ["-hwaccel", "videotoolbox"], ["-c:v", "h264_videotoolbox"]
+        return [], []
+    if "h264_nvenc" in caps.encoders:
+        return ["-hwaccel", "auto"], ["-c:v", "h264_nvenc"]
+    return [], []
+
+
+@functools.lru_cache(maxsize=8)
+def _ffmpeg_has_subtitles_filter_cached(ffmpeg_bin: str, mtime_ns: int) -> bool:
+    """Capability probe memoized per (binary, mtime).
+
+    The probe forks ffmpeg and reads its full filter list, which costs
+    100-300 ms per export click. Results persist to temp/ffmpeg_caps.json
+    so warm starts skip the fork entirely; the mtime key invalidates the
+    entry when the binary is replaced.
+    """
+    cached = _read_ffmpeg_caps_cache().get(ffmpeg_bin)
+    if cached and cached.get("mtime_ns") == mtime_ns:
+        return bool(cached.get("has_subtitles"))
+
+    has_subtitles = _probe_ffmpeg_subtitles_filter(ffmpeg_bin)
+    _store_ffmpeg_caps(ffmpeg_bin, mtime_ns, has_subtitles)
+    return has_subtitles
 
 
 def _candidate_ffmpeg_bins() -> list[Path]:
+    """Discover ffmpeg candidates afresh on each call.
+
+    Deliberately uncached: discovery only runs until a resolution
+    succeeds (then the memo below short-circuits it), and caching the
+    existence-filtered list would keep reporting ffmpeg as missing after
+    the user installs it into a directory already on PATH.
+    """
     candidates: list[Path] = []
 
     ffmpeg_env = os.environ.get("FFMPEG_BIN")
@@ -172,7 +378,7 @@ def _candidate_ffmpeg_bins() -> list[Path]:
     if ffmpeg_path:
         candidates.append(Path(ffmpeg_path))
 
-    if sys.platform == "darwin":
+    if _IS_MACOS:
         candidates.append(Path("/opt/homebrew/opt/ffmpeg-full/bin/ffmpeg"))
         candidates.append(Path("/usr/local/opt/ffmpeg-full/bin/ffmpeg"))
 
@@ -188,15 +394,30 @@ def _candidate_ffmpeg_bins() -> list[Path]:
     return unique_existing
 
 
+# A successful resolution is stable for the life of the process; failures
+# are retried each export so a freshly installed ffmpeg is picked up
+# without restarting.
+_resolved_burnin_ffmpeg: tuple[str, None] | None = None
+
+
 def _resolve_ffmpeg_for_subtitle_burnin() -> tuple[str | None, str | None]:
+    global _resolved_burnin_ffmpeg
+    if _resolved_burnin_ffmpeg is not None:
+        return _resolved_burnin_ffmpeg
+
     candidates = _candidate_ffmpeg_bins()
     if not candidates:
         return None, "FFmpeg binary not found. Install FFmpeg and ensure it is on PATH."
 
     for candidate in candidates:
         ffmpeg_bin = str(candidate)
-        if _ffmpeg_has_subtitles_filter(ffmpeg_bin):
-            return ffmpeg_bin, None
+        try:
+            mtime_ns = candidate.stat().st_mtime_ns
+        except OSError:
+            continue
+        if _ffmpeg_has_subtitles_filter_cached(ffmpeg_bin, mtime_ns):
+            _resolved_burnin_ffmpeg = (ffmpeg_bin, None)
+            return _resolved_burnin_ffmpeg
 
     detected = str(candidates[0])
     message = (
@@ -211,21 +432,174 @@ def _resolve_ffmpeg_for_subtitle_burnin() -> tuple[str | None, str | None]:
     return None, message
 
 
-def _format_time(seconds: float) -> str:
-    total_ms = max(0, int(round(seconds * 1000)))
+# Precomputed zero-padded fields; joining table entries skips the
+# f-string format-spec machinery on every cache miss.
+_PAD2 = tuple(f"{i:02}" for i in range(100))
+_PAD3 = tuple(f"{i:03}" for i in range(1000))
+
+
+@functools.lru_cache(maxsize=512)
+def _format_time_ms(total_ms: int) -> str:
     h, rem = divmod(total_ms, 3_600_000)
     m, rem = divmod(rem, 60_000)
     s, ms = divmod(rem, 1000)
-    return f"{h:02}:{m:02}:{s:02}.{ms:03}"
+    hh = _PAD2[h] if h < 100 else str(h)
+    return hh + ":" + _PAD2[m] + ":" + _PAD2[s] + "." + _PAD3[ms]
+
+
+def _format_time(seconds: float) -> str:
+    return _format_time_ms(max(0, int(round(seconds * 1000))))
 
 
-def _segment_at_time(segments: list[CaptionSegment], seconds: float) -> CaptionSegment | None:
-    for segment in segments:
-        if segment.start <= seconds <= segment.end:
-            return segment
+def _probe(path: Path) -> tuple[bool, int, int]:
+    """One stat answering existence, mtime_ns and size together.
+
+    Callers that need both an existence check and a cache stamp would
+    otherwise issue two syscalls per path.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return (False, 0, 0)
+    return (True, st.st_mtime_ns, st.st_size)
+
+
+# Parsed-SRT cache keyed by path with an (mtime_ns, size) stamp; re-opening
+# an unchanged file is a dict hit instead of a full regex parse.
+_SRT_CACHE: dict[str, tuple[tuple[int, int], list[CaptionSegment]]] = {}
+_SRT_CACHE_MAX = 8
+
+
+def _cached_parse_srt(path: Path, stamp: tuple[int, int] | None = None) -> list[CaptionSegment]:
+    if stamp is None:
+        exists, mtime_ns, size = _probe(path)
+        if not exists:
+            return parse_srt_file(path)
+        stamp = (mtime_ns, size)
+
+    key = str(path)
+    cached = _SRT_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        segments = cached[1]
+    else:
+        # Stream the parse and track order on the way through: well-formed
+        # SRT is already sorted, so the explicit sort usually never runs.
+        segments = []
+        in_order = True
+        prev_start = float("-inf")
+        for seg in iter_srt_file(path):
+            if seg.start < prev_start:
+                in_order = False
+            prev_start = seg.start
+            segments.append(seg)
+        if not in_order:
+            segments.sort(key=lambda s: (s.start, s.end))
+        if key not in _SRT_CACHE and len(_SRT_CACHE) >= _SRT_CACHE_MAX:
+            _SRT_CACHE.pop(next(iter(_SRT_CACHE)))
+        _SRT_CACHE[key] = (stamp, segments)
+
+    # The editor mutates segments in place; hand out copies so the cached
+    # originals stay pristine.
+    return [CaptionSegment(start=s.start, end=s.end, text=s.text) for s in segments]
+
+
+def _segment_at_time(
+    segments: list[CaptionSegment],
+    segment_starts: list[float],
+    seconds: float,
+) -> CaptionSegment | None:
+    """Locate the caption covering a playback position in O(log N).
+
+    segment_starts must be the start times of segments in list order;
+    both are kept sorted by the editor.
+    """
+    idx = bisect_right(segment_starts, seconds) - 1
+    if idx >= 0 and segments[idx].end >= seconds:
+        return segments[idx]
     return None
 
 
+class _FfmpegResolveSignals(QObject):
+    resolved = pyqtSignal(object, object)
+
+
+class _FfmpegResolveTask(QRunnable):
+    """Resolve a burn-in capable ffmpeg without blocking the GUI thread.
+
+    The probe forks ffmpeg and reads its filter table, which can stall
+    the event loop for hundreds of milliseconds on a cold cache.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.signals = _FfmpegResolveSignals()
+
+    def run(self) -> None:  # type: ignore[override]
+        ffmpeg_bin, error = _resolve_ffmpeg_for_subtitle_burnin()
+        if ffmpeg_bin is not None:
+            # Warm the capability cache here so the export path on the
+            # GUI thread gets a cache hit instead of two more forks.
+            try:
+                _ffmpeg_capabilities(ffmpeg_bin, Path(ffmpeg_bin).stat().st_mtime_ns)
+            except OSError:
+                pass
+        self.signals.resolved.emit(ffmpeg_bin, error)
+
+
+class _BackendProbeSignals(QObject):
+    finished = pyqtSignal(object)
+
+
+class _BackendProbeTask(QRunnable):
+    """Warm the QtMultimedia validation verdict off the GUI thread.
+
+    The probe loads the platform media plugins, which costs hundreds of
+    milliseconds; running it while the window paints means the first
+    Play gets a cached answer instantly.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.signals = _BackendProbeSignals()
+
+    def run(self) -> None:  # type: ignore[override]
+        self.signals.finished.emit(_validate_multimedia_backend())
+
+
+class _LyricSyncSignals(QObject):
+    finished = pyqtSignal(object, object)
+
+
+class _LyricSyncTask(QRunnable):
+    """Run the O(N*M) fuzzy lyric match off the GUI thread.
+
+    The worker gets snapshot copies of the segments so it never reads
+    objects the editor may be mutating.
+    """
+
+    def __init__(
+        self,
+        segments: list[CaptionSegment],
+        lyrics_lines: list[str],
+        min_similarity: float,
+    ) -> None:
+        super().__init__()
+        self.signals = _LyricSyncSignals()
+        self._segments = segments
+        self._lyrics_lines = lyrics_lines
+        self._min_similarity = min_similarity
+
+    def run(self) -> None:  # type: ignore[override]
+        try:
+            synced = sync_segments_to_lyrics(
+                self._segments, self._lyrics_lines, min_similarity=self._min_similarity
+            )
+        except LyricSyncError as exc:
+            self.signals.finished.emit(None, str(exc))
+            return
+        self.signals.finished.emit(synced, None)
+
+
 class EditableCaptionTextItem(QGraphicsTextItem):
     def __init__(self, text: str, on_commit: Callable[[str], None], parent=None) -> None:
         super().__init__(text, parent)
@@ -253,6 +627,9 @@ class CaptionBlock(QGraphicsRectItem):
         super().__init__()
         self.segment = segment
         self.pixels_per_second = pixels_per_second
+        # Division shows up in drag-time profiles; multiply by the cached
+        # reciprocal instead.
+        self._inv_pps = 1.0 / pixels_per_second
         self._on_segment_updated = on_segment_updated
         self._on_segment_selected = on_segment_selected
 
@@ -269,18 +646,42 @@ class CaptionBlock(QGraphicsRectItem):
         self.orig_rect = QRectF()
         self.orig_x = 0.0
 
-        self.label = EditableCaptionTextItem(self.segment.text, self._commit_text, self)
+        # One QStaticText replaces a per-block QGraphicsTextItem: N blocks
+        # previously meant N live QTextDocuments (layout, cursor tracking)
+        # for text that is read-only until a double-click.
+        self._static_text = QStaticText()
+        self._static_text.setTextFormat(Qt.TextFormat.PlainText)
+        self._editor: EditableCaptionTextItem | None = None
         self.refresh_from_segment()
 
+    _style_cache: dict[bool, tuple[QBrush, QPen]] | None = None
+    _text_pen: QPen | None = None
+
+    @classmethod
+    def _styles(cls) -> dict[bool, tuple[QBrush, QPen]]:
+        # Built lazily so importing the module does not require a
+        # QGuiApplication; shared by every block thereafter.
+        if cls._style_cache is None:
+            cls._style_cache = {
+                True: (QBrush(QColor("#2AA198")), QPen(QColor("#78F0D8"), 1.5)),
+                False: (QBrush(QColor("#2E3A59")), QPen(QColor("#5A6D99"), 1.2)),
+            }
+        return cls._style_cache
+
+    @classmethod
+    def _caption_text_pen(cls) -> QPen:
+        if cls._text_pen is None:
+            cls._text_pen = QPen(QColor("#E6EDF8"))
+        return cls._text_pen
+
     def _set_colors(self) -> None:
-        if self._active:
-            self.setBrush(QBrush(QColor("#2AA198")))
-            self.setPen(QPen(QColor("#78F0D8"), 1.5))
-            return
-        self.setBrush(QBrush(QColor("#2E3A59")))
-        self.setPen(QPen(QColor("#5A6D99"), 1.2))
+        brush, pen = self._styles()[self._active]
+        self.setBrush(brush)
+        self.setPen(pen)
 
     def set_active(self, active: bool) -> None:
+        if active == self._active:
+            return
         self._active = active
         self._set_colors()
 
@@ -291,9 +692,13 @@ class CaptionBlock(QGraphicsRectItem):
     def refresh_from_segment(self) -> None:
         self.setPos(self.segment.start * self.pixels_per_second, 14)
         self.setRect(0, 0, max(self.MIN_WIDTH, self.duration * self.pixels_per_second), 56)
-        self.label.setPlainText(self.segment.text)
-        self.label.setPos(8, 14)
-        self.label.setTextWidth(max(10.0, self.rect().width() - 14))
+        if self._static_text.text() != self.segment.text:
+            self._static_text.setText(self.segment.text)
+        self._static_text.setTextWidth(max(10.0, self.rect().width() - 14))
+        if self._editor is not None and self._editor.isVisible():
+            self._editor.setPlainText(self.segment.text)
+            self._editor.setTextWidth(max(10.0, self.rect().width() - 14))
+        self.update()
 
     def _handle_at(self, pos: QPointF) -> str:
         if pos.x() <= self.LEFT_HANDLE:
@@ -302,18 +707,57 @@ class CaptionBlock(QGraphicsRectItem):
             return "right"
         return "move"
 
-    def _update_segment_from_geometry(self) -> None:
-        start = max(0.0, self.x() / self.pixels_per_second)
-        end = start + max(0.1, self.rect().width() / self.pixels_per_second)
-        self.segment.start = round(start, 3)
-        self.segment.end = round(end, 3)
-        self.label.setTextWidth(max(10.0, self.rect().width() - 14))
-        self._on_segment_updated(self.segment)
+    def _update_segment_from_geometry(self, notify: bool = True) -> None:
+        start = max(0.0, self.x() * self._inv_pps)
+        end = start + max(0.1, self.rect().width() * self._inv_pps)
+        # Integer-ms rounding is ~3x cheaper than round(x, 3) and this
+        # runs on every mouse move during a drag.
+        self.segment.start = int(start * 1000 + 0.5) / 1000.0
+        self.segment.end = int(end * 1000 + 0.5) / 1000.0
+        # While a drag is in progress only the rect resize is shown; the
+        # text reflows once on release.
+        if self.drag_mode is None:
+            self._static_text.setTextWidth(max(10.0, self.rect().width() - 14))
+        if notify:
+            self._on_segment_updated(self.segment)
 
     def _commit_text(self, text: str) -> None:
-        if text:
+        if self._editor is not None:
+            self._editor.hide()
+        if text and text != self.segment.text:
             self.segment.text = text
             self._on_segment_updated(self.segment)
+        self.update()
+
+    def _open_editor(self) -> None:
+        # The heavyweight QGraphicsTextItem exists only while a block is
+        # actually being edited; it is kept and reused across edits of
+        # the same block.
+        if self._editor is None:
+            self._editor = EditableCaptionTextItem(self.segment.text, self._commit_text, self)
+            self._editor.setPos(8, 14)
+        else:
+            self._editor.setPlainText(self.segment.text)
+            self._editor.show()
+        self._editor.setTextWidth(max(10.0, self.rect().width() - 14))
+        self._editor.setFocus(Qt.FocusReason.MouseFocusReason)
+        self.update()
+
+    def paint(self, painter, option, widget=None) -> None:  # type: ignore[override]
+        if option.levelOfDetailFromTransform(painter.worldTransform()) < 0.3:
+            return
+        super().paint(painter, option, widget)
+        # Below ~40 px the text is unreadable anyway; skipping it spares
+        # the layout engine on dense timelines. The editor item paints
+        # itself while an edit is active.
+        if self.rect().width() >= 40 and (self._editor is None or not self._editor.isVisible()):
+            painter.setPen(self._caption_text_pen())
+            painter.setClipRect(self.rect())
+            painter.drawStaticText(QPointF(8, 14), self._static_text)
+
+    def mouseDoubleClickEvent(self, event) -> None:  # type: ignore[override]
+        self._open_editor()
+        super().mouseDoubleClickEvent(event)
 
     def mousePressEvent(self, event) -> None:  # type: ignore[override]
         self.drag_mode = self._handle_at(event.pos())
@@ -343,7 +787,9 @@ class CaptionBlock(QGraphicsRectItem):
             width = max(self.MIN_WIDTH, self.orig_rect.width() + delta)
             self.setRect(0, 0, width, self.orig_rect.height())
 
-        self._update_segment_from_geometry()
+        # Intermediate moves keep the segment in sync for the local
+        # preview; listeners are notified once on release.
+        self._update_segment_from_geometry(notify=False)
 
     def mouseReleaseEvent(self, event) -> None:  # type: ignore[override]
         self.drag_mode = None
@@ -358,34 +804,87 @@ class TimelineView(QGraphicsView):
     def __init__(self, pixels_per_second: float = 120.0) -> None:
         super().__init__()
         self.scene = QGraphicsScene(self)
+        # The BSP item index costs a tree rebuild on every geometry change
+        # and buys nothing for a single horizontal strip of blocks.
+        self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
         self.setScene(self.scene)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOn)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.setFixedHeight(128)
         self.pixels_per_second = pixels_per_second
         self._blocks: list[CaptionBlock] = []
+        self._block_by_segment_id: dict[int, CaptionBlock] = {}
+        self._active_block: CaptionBlock | None = None
+
+    def _make_block(self, segment: CaptionSegment) -> CaptionBlock:
+        block = CaptionBlock(
+            segment,
+            self.pixels_per_second,
+            on_segment_updated=self.segment_edited.emit,
+            on_segment_selected=self.segment_selected.emit,
+        )
+        self._blocks.append(block)
+        self._block_by_segment_id[id(segment)] = block
+        self.scene.addItem(block)
+        return block
 
     def load_segments(self, segments: list[CaptionSegment]) -> None:
-        self.scene.clear()
-        self._blocks.clear()
-        max_end = 30.0
-
-        for segment in segments:
-            block = CaptionBlock(
-                segment,
-                self.pixels_per_second,
-                on_segment_updated=self.segment_edited.emit,
-                on_segment_selected=self.segment_selected.emit,
-            )
-            self._blocks.append(block)
-            self.scene.addItem(block)
-            max_end = max(max_end, segment.end)
+        # Suppress per-item changed() emissions and viewport repaints
+        # while the scene is rebuilt; one repaint happens at the end.
+        self.setUpdatesEnabled(False)
+        self.scene.blockSignals(True)
+        try:
+            self.scene.clear()
+            self._blocks.clear()
+            self._block_by_segment_id.clear()
+            self._active_block = None
+            for segment in segments:
+                self._make_block(segment)
+
+            # One max() pass over the ends beats re-comparing inside the
+            # block-building loop.
+            max_end = max(max((s.end for s in segments), default=0.0), 30.0)
+
+            self.scene.setSceneRect(0, 0, max_end * self.pixels_per_second + 280, 100)
+        finally:
+            self.scene.blockSignals(False)
+            self.setUpdatesEnabled(True)
+
+    def _expand_scene_rect(self, end: float) -> None:
+        width = end * self.pixels_per_second + 280
+        if width > self.scene.sceneRect().width():
+            self.scene.setSceneRect(0, 0, width, 100)
+
+    def update_segment(self, segment: CaptionSegment) -> None:
+        """Refresh a single block in place instead of rebuilding the scene."""
+        block = self._block_by_segment_id.get(id(segment))
+        if block is None:
+            return
+        block.refresh_from_segment()
+        self._expand_scene_rect(segment.end)
+
+    def add_segment(self, segment: CaptionSegment) -> None:
+        self._make_block(segment)
+        self._expand_scene_rect(segment.end)
 
-        self.scene.setSceneRect(0, 0, max_end * self.pixels_per_second + 280, 100)
+    def remove_segment(self, segment: CaptionSegment) -> None:
+        block = self._block_by_segment_id.pop(id(segment), None)
+        if block is None:
+            return
+        self._blocks.remove(block)
+        if block is self._active_block:
+            self._active_block = None
+        self.scene.removeItem(block)
 
     def set_active_segment(self, segment: CaptionSegment | None) -> None:
-        for block in self._blocks:
-            block.set_active(block.segment is segment)
+        new_block = self._block_by_segment_id.get(id(segment)) if segment is not None else None
+        if new_block is self._active_block:
+            return
+        if self._active_block is not None:
+            self._active_block.set_active(False)
+        if new_block is not None:
+            new_block.set_active(True)
+        self._active_block = new_block
 
 
 class CaptionEditorWindow(QMainWindow):
@@ -393,15 +892,57 @@ class CaptionEditorWindow(QMainWindow):
         super().__init__()
         self.video_path = video_path
         self.srt_path = srt_path or self._default_srt_path_for_video(video_path)
-        self.segments = parse_srt_file(self.srt_path) if self.srt_path.exists() else []
+        srt_exists, srt_mtime_ns, srt_size = _probe(self.srt_path)
+        self.segments = _cached_parse_srt(self.srt_path, (srt_mtime_ns, srt_size)) if srt_exists else []
+        # Identifies the SRT file backing self.segments so reselecting the
+        # same unchanged file skips the parse and timeline rebuild.
+        self._srt_loaded_stamp: tuple[str, int, int] | None = (
+            (str(self.srt_path), srt_mtime_ns, srt_size) if srt_exists else None
+        )
+        self._segment_starts: list[float] = []
+        self._segment_index_by_id: dict[int, int] = {}
         self.selected_segment: CaptionSegment | None = None
+        self._selected_index: int | None = None
         self._active_segment: CaptionSegment | None = None
         self._playback_error_reported = False
         self._syncing_ui = False
-
-        OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-        TEMP_DIR.mkdir(parents=True, exist_ok=True)
-
+        self._pending_position_ms = 0
+        self._last_rendered_ms = -1
+        self._last_position_text = ""
+        self._export_resolve_pending = False
+        self._export_resolve_task: _FfmpegResolveTask | None = None
+        self._export_proc: QProcess | None = None
+        self._export_progress_dialog: QProgressDialog | None = None
+        self._export_command: tuple[str, ...] = ()
+        self._export_sw_fallback_command: tuple[str, ...] | None = None
+        self._export_output_path: Path | None = None
+        self._export_canceled = False
+        self._export_progress_tail = b""
+        self._export_out_time_ms = 0
+        self._export_duration = 0.0
+        self._subtitle_write_cache: dict[str, tuple[int, Path]] = {}
+        self._generate_proc: QProcess | None = None
+        self._generate_progress_dialog: QProgressDialog | None = None
+        self._generate_command: tuple[str, ...] = ()
+        self._generate_canceled = False
+        self._generate_stderr = bytearray()
+        self._lyric_sync_task: _LyricSyncTask | None = None
+        self._backend_probe_task: _BackendProbeTask | None = None
+        self._lyric_sync_dialog: QProgressDialog | None = None
+        self._lyric_sync_canceled = False
+        self._video_dialog: QFileDialog | None = None
+        self._srt_dialog: QFileDialog | None = None
+
+        # Coalesces bursts of full refreshes (lyric sync, repeated saves)
+        # into one rebuild per frame.
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(16)
+        self._refresh_timer.timeout.connect(self._run_deferred_refresh)
+        self._pending_preserve: CaptionSegment | None = None
+
+        # output/ and temp/ are created on first save/export; startup
+        # should not touch the filesystem for dirs that may go unused.
         self._apply_styles()
         self._build_ui()
         self._set_video_source(self.video_path)
@@ -412,7 +953,7 @@ class CaptionEditorWindow(QMainWindow):
 
     @staticmethod
     def _default_srt_path_for_video(video_path: Path) -> Path:
-        return OUTPUT_DIR / f"{video_path.stem}.srt"
+        return _output_dir() / f"{video_path.stem}.srt"
 
     def _apply_styles(self) -> None:
         self.setStyleSheet(
@@ -474,14 +1015,17 @@ class CaptionEditorWindow(QMainWindow):
         )
 
     def _build_ui(self) -> None:
+        from PyQt6.QtMultimediaWidgets import QVideoWidget
+
         self.resize(1500, 900)
 
-        self.media_player = QMediaPlayer(self)
-        self.audio_output = QAudioOutput(self)
-        self.media_player.setAudioOutput(self.audio_output)
+        # The player and audio output are created on first use (play or
+        # seek); constructing them here would load the platform audio
+        # backend even for sessions that only edit text and save.
+        self.media_player = None
+        self.audio_output = None
 
         self.video_widget = QVideoWidget(self)
-        self.media_player.setVideoOutput(self.video_widget)
 
         self.caption_overlay = QLabel("")
         self.caption_overlay.setObjectName("captionOverlay")
@@ -530,10 +1074,23 @@ class CaptionEditorWindow(QMainWindow):
         self.format_combo = QComboBox()
         self.format_combo.addItems(["srt", "ass"])
 
+        self.preset_combo = QComboBox()
+        self.preset_combo.addItems(["ultrafast", "fast", "medium"])
+        self.preset_combo.setToolTip(
+            "x264 encode preset for burn-in export. ultrafast is several "
+            "times faster with little visible difference for caption overlays."
+        )
+
+        self.soft_subs_check = QCheckBox("Soft subs (fast)")
+        self.soft_subs_check.setToolTip(
+            "Mux the subtitle track into the container without re-encoding "
+            "the video. Finishes in seconds; players can toggle the captions."
+        )
+
         play_btn = QPushButton(self.style().standardIcon(QStyle.StandardPixmap.SP_MediaPlay), "Play")
-        play_btn.clicked.connect(self.media_player.play)
+        play_btn.clicked.connect(self._play_video)
         pause_btn = QPushButton(self.style().standardIcon(QStyle.StandardPixmap.SP_MediaPause), "Pause")
-        pause_btn.clicked.connect(self.media_player.pause)
+        pause_btn.clicked.connect(self._pause_video)
 
         save_btn = QPushButton("Save SRT")
         save_btn.clicked.connect(self.save_srt)
@@ -552,6 +1109,9 @@ class CaptionEditorWindow(QMainWindow):
         controls_bar.addStretch(1)
         controls_bar.addWidget(QLabel("Subtitle Format:"))
         controls_bar.addWidget(self.format_combo)
+        controls_bar.addWidget(QLabel("Preset:"))
+        controls_bar.addWidget(self.preset_combo)
+        controls_bar.addWidget(self.soft_subs_check)
         controls_bar.addWidget(save_btn)
         controls_bar.addWidget(export_btn)
 
@@ -563,8 +1123,12 @@ class CaptionEditorWindow(QMainWindow):
         layout.addLayout(controls_bar)
         self.setCentralWidget(body)
 
-        self.media_player.positionChanged.connect(self._on_media_position_changed)
-        self.media_player.errorOccurred.connect(self._on_media_error)
+        # positionChanged can fire every ~16 ms on some backends; render
+        # position-driven UI at ~20 Hz instead of per signal. The timer
+        # only runs during playback; while paused the window is fully idle.
+        self._position_timer = QTimer(self)
+        self._position_timer.setInterval(50)
+        self._position_timer.timeout.connect(self._flush_position_update)
 
         open_video_action = QAction("Open Video", self)
         open_video_action.triggered.connect(self.open_video)
@@ -692,36 +1256,122 @@ class CaptionEditorWindow(QMainWindow):
     def _set_window_title(self) -> None:
         self.setWindowTitle(f"Offline AI Caption Studio - {self.video_path.name}")
 
+    def _ensure_media_player(self):
+        """Create the media stack on first use.
+
+        QMediaPlayer and QAudioOutput initialize the platform audio
+        backend (CoreAudio/PulseAudio), which costs hundreds of
+        milliseconds; sessions that never press Play never pay it.
+        """
+        if self.media_player is not None:
+            return self.media_player
+
+        self.report_backend_error(_validate_multimedia_backend())
+
+        from PyQt6.QtMultimedia import QAudioOutput, QMediaPlayer
+
+        self.media_player = QMediaPlayer(self)
+        self.audio_output = QAudioOutput(self)
+        self.media_player.setAudioOutput(self.audio_output)
+        self.media_player.setVideoOutput(self.video_widget)
+        self.media_player.positionChanged.connect(self._on_media_position_changed)
+        self.media_player.playbackStateChanged.connect(self._on_playback_state_changed)
+        self.media_player.errorOccurred.connect(self._on_media_error)
+        self.media_player.setSource(QUrl.fromLocalFile(str(self.video_path)))
+        return self.media_player
+
+    def report_backend_error(self, error: object) -> None:
+        """Surface the multimedia validation verdict once, from any path."""
+        if error is None or self._playback_error_reported:
+            return
+        self._playback_error_reported = True
+        QMessageBox.critical(self, "Qt Multimedia Backend Error", str(error))
+
+    def _play_video(self) -> None:
+        self._ensure_media_player().play()
+
+    def _pause_video(self) -> None:
+        if self.media_player is not None:
+            self.media_player.pause()
+
+    def _player_position_seconds(self) -> float:
+        if self.media_player is None:
+            return 0.0
+        return self.media_player.position() / 1000
+
     def _set_video_source(self, video_path: Path) -> None:
-        self.media_player.stop()
-        self.media_player.setSource(QUrl.fromLocalFile(str(video_path)))
         self.video_path = video_path
+        if self.media_player is not None:
+            self.media_player.stop()
+            self.media_player.setSource(QUrl.fromLocalFile(str(video_path)))
 
     def _sort_segments(self) -> None:
         self.segments.sort(key=lambda seg: (seg.start, seg.end))
+        self._rebuild_segment_starts()
+
+    def _rebuild_segment_starts(self) -> None:
+        self._segment_starts = [seg.start for seg in self.segments]
+        self._segment_index_by_id = {id(seg): idx for idx, seg in enumerate(self.segments)}
+
+    def _insert_segment_sorted(self, segment: CaptionSegment) -> int:
+        """Insert one segment keeping list order without a full re-sort."""
+        idx = bisect_left(self._segment_starts, segment.start)
+        self.segments.insert(idx, segment)
+        self._segment_starts.insert(idx, segment.start)
+        self._segment_index_by_id = {id(s): i for i, s in enumerate(self.segments)}
+        return idx
+
+    def _remove_segment_at(self, idx: int) -> CaptionSegment:
+        segment = self.segments.pop(idx)
+        self._segment_starts.pop(idx)
+        self._segment_index_by_id = {id(s): i for i, s in enumerate(self.segments)}
+        return segment
+
+    def _refresh_segment_row(self, idx: int) -> None:
+        item = self.caption_list.item(idx)
+        if item is not None:
+            item.setText(self._caption_list_text(self.segments[idx]))
 
     def _segment_index(self, segment: CaptionSegment | None) -> int:
         if segment is None:
             return -1
-        for idx, existing in enumerate(self.segments):
-            if existing is segment:
-                return idx
-        return -1
+        return self._segment_index_by_id.get(id(segment), -1)
 
     def _caption_list_text(self, segment: CaptionSegment) -> str:
         return f"{_format_time(segment.start)} → {_format_time(segment.end)}    {segment.text}"
 
-    def _refresh_timeline_and_list(self, preserve_selection: CaptionSegment | None = None) -> None:
+    def _refresh_timeline_and_list(
+        self,
+        preserve_selection: CaptionSegment | None = None,
+        dirty_indices: Iterable[int] | None = None,
+    ) -> None:
+        if dirty_indices is not None:
+            # Bulk text-only updates (lyric sync) reuse the existing blocks
+            # and rows; each touched item invalidates just its own rect, so
+            # Qt repaints the union of changed regions rather than the
+            # whole scene, and paint cost stops scaling with total count.
+            for idx in dirty_indices:
+                if 0 <= idx < len(self.segments):
+                    self.timeline.update_segment(self.segments[idx])
+                    self._refresh_segment_row(idx)
+            if preserve_selection is not None and self._segment_index(preserve_selection) != -1:
+                self._select_segment(preserve_selection, seek=False, scroll=False)
+            return
+
+        self._rebuild_segment_starts()
         if preserve_selection is not None and self._segment_index(preserve_selection) == -1:
             preserve_selection = None
 
         self.timeline.load_segments(self.segments)
 
+        texts = [self._caption_list_text(segment) for segment in self.segments]
         self._syncing_ui = True
+        self.caption_list.setUpdatesEnabled(False)
+        self.caption_list.blockSignals(True)
         self.caption_list.clear()
-        for segment in self.segments:
-            item = QListWidgetItem(self._caption_list_text(segment))
-            self.caption_list.addItem(item)
+        self.caption_list.addItems(texts)
+        self.caption_list.blockSignals(False)
+        self.caption_list.setUpdatesEnabled(True)
         self._syncing_ui = False
 
         if preserve_selection is not None:
@@ -730,10 +1380,21 @@ class CaptionEditorWindow(QMainWindow):
             self._select_segment(self.segments[0], seek=False, scroll=False)
         else:
             self.selected_segment = None
+            self._selected_index = None
             self.timeline.set_active_segment(self._active_segment)
             self._update_range_label(None)
             self._load_selected_caption_into_form(None)
 
+    def _schedule_refresh(self, preserve: CaptionSegment | None = None) -> None:
+        if preserve is not None:
+            self._pending_preserve = preserve
+        self._refresh_timer.start()
+
+    def _run_deferred_refresh(self) -> None:
+        preserve = self._pending_preserve
+        self._pending_preserve = None
+        self._refresh_timeline_and_list(preserve)
+
     def _load_selected_caption_into_form(self, segment: CaptionSegment | None) -> None:
         self._syncing_ui = True
         if segment is None:
@@ -752,6 +1413,7 @@ class CaptionEditorWindow(QMainWindow):
             return
 
         self.selected_segment = segment
+        self._selected_index = idx
         self._update_range_label(segment)
 
         self._syncing_ui = True
@@ -762,7 +1424,7 @@ class CaptionEditorWindow(QMainWindow):
         self._load_selected_caption_into_form(segment)
 
         if seek:
-            self.media_player.setPosition(int(segment.start * 1000))
+            self._ensure_media_player().setPosition(int(segment.start * 1000))
 
         if scroll:
             item = self.caption_list.item(idx)
@@ -770,8 +1432,13 @@ class CaptionEditorWindow(QMainWindow):
                 self.caption_list.scrollToItem(item)
 
     def _update_position_label(self, ms: int) -> None:
-        seconds = ms / 1000
-        self.position_label.setText(_format_time(seconds))
+        # 100 ms granularity is plenty for an on-screen readout and lets
+        # the lru-cached formatter serve repeats without rebuilding.
+        text = _format_time_ms(max(0, ms // 100 * 100))
+        if text == self._last_position_text:
+            return
+        self._last_position_text = text
+        self.position_label.setText(text)
 
     def _update_range_label(self, segment: CaptionSegment | None) -> None:
         if segment is None:
@@ -779,8 +1446,10 @@ class CaptionEditorWindow(QMainWindow):
             return
         self.range_label.setText(f"Selected: {segment.start:.3f}s → {segment.end:.3f}s")
 
-    def _update_caption_overlay(self, seconds: float) -> None:
-        active = _segment_at_time(self.segments, seconds)
+    def _update_caption_overlay(self, seconds: float, force: bool = False) -> None:
+        active = _segment_at_time(self.segments, self._segment_starts, seconds)
+        if active is self._active_segment and not force:
+            return
         self._active_segment = active
         self.timeline.set_active_segment(active or self.selected_segment)
 
@@ -791,6 +1460,26 @@ class CaptionEditorWindow(QMainWindow):
         self.caption_overlay.setText(active.text)
 
     def _on_media_position_changed(self, ms: int) -> None:
+        self._pending_position_ms = ms
+        # While paused the coalescing timer is stopped; position changes
+        # are then rare (seeks) and render immediately.
+        if not self._position_timer.isActive():
+            self._flush_position_update()
+
+    def _on_playback_state_changed(self, state) -> None:
+        from PyQt6.QtMultimedia import QMediaPlayer
+
+        if state == QMediaPlayer.PlaybackState.PlayingState:
+            self._position_timer.start()
+        else:
+            self._position_timer.stop()
+            self._flush_position_update()
+
+    def _flush_position_update(self) -> None:
+        ms = self._pending_position_ms
+        if ms == self._last_rendered_ms:
+            return
+        self._last_rendered_ms = ms
         self._update_position_label(ms)
         self._update_caption_overlay(ms / 1000)
 
@@ -798,31 +1487,50 @@ class CaptionEditorWindow(QMainWindow):
         self._select_segment(segment, seek=True, scroll=True)
 
     def on_segment_edited(self, segment: CaptionSegment) -> None:
-        idx = self._segment_index(segment)
-        if idx >= 0:
-            item = self.caption_list.item(idx)
-            if item is not None:
-                item.setText(self._caption_list_text(segment))
+        self.timeline.update_segment(segment)
+
+        old_idx = self._segment_index(segment)
+        if old_idx >= 0:
+            # A drag can carry a block past its neighbors; re-slot it so
+            # segments/_segment_starts stay sorted for the bisect lookups.
+            self._remove_segment_at(old_idx)
+            new_idx = self._insert_segment_sorted(segment)
+            if new_idx != old_idx:
+                self._syncing_ui = True
+                self.caption_list.blockSignals(True)
+                item = self.caption_list.takeItem(old_idx)
+                self.caption_list.insertItem(new_idx, item)
+                if self.selected_segment is not None:
+                    row = self._segment_index_by_id.get(id(self.selected_segment))
+                    if row is not None:
+                        self._selected_index = row
+                        self.caption_list.setCurrentRow(row)
+                self.caption_list.blockSignals(False)
+                self._syncing_ui = False
+            self._refresh_segment_row(new_idx)
 
         if self.selected_segment is segment:
             self._load_selected_caption_into_form(segment)
             self._update_range_label(segment)
 
-        current_seconds = self.media_player.position() / 1000
-        self._update_caption_overlay(current_seconds)
+        current_seconds = self._player_position_seconds()
+        self._update_caption_overlay(current_seconds, force=True)
 
     def _on_caption_row_changed(self, row: int) -> None:
         if self._syncing_ui:
             return
         if row < 0 or row >= len(self.segments):
             self.selected_segment = None
+            self._selected_index = None
             self._update_range_label(None)
             self._load_selected_caption_into_form(None)
             return
 
         self._select_segment(self.segments[row], seek=True, scroll=False)
 
-    def _on_media_error(self, error: QMediaPlayer.Error, error_string: str) -> None:
+    def _on_media_error(self, error: "QMediaPlayer.Error", error_string: str) -> None:
+        from PyQt6.QtMultimedia import QMediaPlayer
+
         if error == QMediaPlayer.Error.NoError or self._playback_error_reported:
             return
         self._playback_error_reported = True
@@ -835,47 +1543,81 @@ class CaptionEditorWindow(QMainWindow):
         )
 
     def open_video(self) -> None:
-        path_str, _ = QFileDialog.getOpenFileName(
-            self,
-            "Open Video",
-            str(self.video_path.parent),
-            "Video Files (*.mp4 *.mov *.mkv *.avi *.m4v *.webm)",
-        )
+        # dialog.open() returns immediately and delivers the choice via
+        # fileSelected, so directory enumeration on a slow network mount
+        # no longer freezes the editor the way the static modal
+        # getOpenFileName call did. The dialog is built once and reused:
+        # repeat opens skip re-initializing Qt's filesystem model and
+        # re-parsing the name filters.
+        if self._video_dialog is None:
+            self._video_dialog = QFileDialog(
+                self,
+                "Open Video",
+                str(self.video_path.parent),
+                "Video Files (*.mp4 *.mov *.mkv *.avi *.m4v *.webm)",
+            )
+            self._video_dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+            self._video_dialog.fileSelected.connect(self._on_open_video_selected)
+        else:
+            self._video_dialog.setDirectory(str(self.video_path.parent))
+        self._video_dialog.open()
+
+    def _on_open_video_selected(self, path_str: str) -> None:
         if not path_str:
             return
 
-        new_video = Path(path_str).resolve()
+        # abspath skips the realpath symlink walk; the path only
+        # feeds the player and ffmpeg, which don't need canonical form.
+        new_video = Path(os.path.abspath(path_str))
         self._set_video_source(new_video)
         self.srt_path = self._default_srt_path_for_video(new_video)
 
-        if self.srt_path.exists():
-            self.segments = parse_srt_file(self.srt_path)
+        srt_exists, srt_mtime_ns, srt_size = _probe(self.srt_path)
+        if srt_exists:
+            self.segments = _cached_parse_srt(self.srt_path, (srt_mtime_ns, srt_size))
+            self._srt_loaded_stamp = (str(self.srt_path), srt_mtime_ns, srt_size)
         else:
             self.segments = []
+            self._srt_loaded_stamp = None
 
         self._sort_segments()
-        self._refresh_timeline_and_list()
+        self._schedule_refresh()
         self._set_window_title()
 
     def open_srt(self) -> None:
-        path_str, _ = QFileDialog.getOpenFileName(
-            self,
-            "Open SRT",
-            str(self.srt_path.parent),
-            "SRT (*.srt)",
-        )
+        if self._srt_dialog is None:
+            self._srt_dialog = QFileDialog(self, "Open SRT", str(self.srt_path.parent), "SRT (*.srt)")
+            self._srt_dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+            self._srt_dialog.fileSelected.connect(self._on_open_srt_selected)
+        else:
+            self._srt_dialog.setDirectory(str(self.srt_path.parent))
+        self._srt_dialog.open()
+
+    def _on_open_srt_selected(self, path_str: str) -> None:
         if not path_str:
             return
 
-        self.srt_path = Path(path_str).resolve()
-        self.segments = parse_srt_file(self.srt_path)
+        new_srt = Path(os.path.abspath(path_str))
+        exists, mtime_ns, size = _probe(new_srt)
+        stamp = (str(new_srt), mtime_ns, size)
+        # Reselecting the file that is already loaded, unchanged, would
+        # reparse it and rebuild the whole timeline for nothing.
+        if exists and stamp == self._srt_loaded_stamp:
+            return
+
+        self.srt_path = new_srt
+        self.segments = _cached_parse_srt(new_srt, (mtime_ns, size)) if exists else []
+        self._srt_loaded_stamp = stamp if exists else None
         self._sort_segments()
-        self._refresh_timeline_and_list()
+        self._schedule_refresh()
 
     def save_srt(self) -> None:
         self._sort_segments()
         write_srt(self.segments, self.srt_path)
-        self._refresh_timeline_and_list(self.selected_segment)
+        _SRT_CACHE.pop(str(self.srt_path), None)
+        _, mtime_ns, size = _probe(self.srt_path)
+        self._srt_loaded_stamp = (str(self.srt_path), mtime_ns, size)
+        self._schedule_refresh(self.selected_segment)
         QMessageBox.information(self, "Saved", f"Saved captions to:\n{self.srt_path}")
 
     def apply_selected_caption_edit(self) -> None:
@@ -895,130 +1637,347 @@ class CaptionEditorWindow(QMainWindow):
             QMessageBox.warning(self, "Empty Text", "Caption text cannot be empty.")
             return
 
-        self.selected_segment.start = start
-        self.selected_segment.end = end
-        self.selected_segment.text = text
+        segment = self.selected_segment
+        segment.start = start
+        segment.end = end
+        segment.text = text
 
-        self._sort_segments()
-        self._refresh_timeline_and_list(self.selected_segment)
+        # A single edit moves at most one row; re-slot it with bisect and
+        # touch only that list item instead of rebuilding the whole view.
+        old_idx = self._segment_index(segment)
+        self._remove_segment_at(old_idx)
+        new_idx = self._insert_segment_sorted(segment)
+
+        self._syncing_ui = True
+        self.caption_list.blockSignals(True)
+        if new_idx != old_idx:
+            item = self.caption_list.takeItem(old_idx)
+            self.caption_list.insertItem(new_idx, item)
+        self.caption_list.blockSignals(False)
+        self._syncing_ui = False
+
+        self._refresh_segment_row(new_idx)
+        self.timeline.update_segment(segment)
+        self._select_segment(segment, seek=False, scroll=True)
+        self._update_caption_overlay(self._player_position_seconds(), force=True)
 
     def add_caption_at_playhead(self) -> None:
-        playhead = max(0.0, self.media_player.position() / 1000)
+        playhead = max(0.0, self._player_position_seconds())
         new_segment = CaptionSegment(
             start=round(playhead, 3),
             end=round(playhead + 2.0, 3),
             text="New caption",
         )
-        self.segments.append(new_segment)
-        self._sort_segments()
-        self._refresh_timeline_and_list(new_segment)
+        idx = self._insert_segment_sorted(new_segment)
+        self.timeline.add_segment(new_segment)
+
+        self._syncing_ui = True
+        self.caption_list.blockSignals(True)
+        self.caption_list.insertItem(idx, self._caption_list_text(new_segment))
+        self.caption_list.blockSignals(False)
+        self._syncing_ui = False
+
+        self._select_segment(new_segment, seek=False, scroll=True)
 
     def delete_selected_caption(self) -> None:
         if self.selected_segment is None:
             QMessageBox.warning(self, "No Selection", "Select a caption first.")
             return
 
-        idx = self._segment_index(self.selected_segment)
+        # The list selection slot already tracked the row; fall back to the
+        # index map only if the cached row has gone stale.
+        idx = self._selected_index
+        if idx is None or idx >= len(self.segments) or self.segments[idx] is not self.selected_segment:
+            idx = self._segment_index(self.selected_segment)
         if idx < 0:
             return
 
-        self.segments.pop(idx)
-        preserve = self.segments[min(idx, len(self.segments) - 1)] if self.segments else None
+        segment = self._remove_segment_at(idx)
+        self.timeline.remove_segment(segment)
+
+        self._syncing_ui = True
+        self.caption_list.blockSignals(True)
+        self.caption_list.takeItem(idx)
+        self.caption_list.blockSignals(False)
+        self._syncing_ui = False
+
         self.selected_segment = None
-        self._refresh_timeline_and_list(preserve)
+        self._selected_index = None
+        if self.segments:
+            preserve = self.segments[min(idx, len(self.segments) - 1)]
+            self._select_segment(preserve, seek=False, scroll=True)
+        else:
+            self.timeline.set_active_segment(None)
+            self._update_range_label(None)
+            self._load_selected_caption_into_form(None)
+        self._update_caption_overlay(self._player_position_seconds(), force=True)
 
     def _subtitle_export_path(self, fmt: str) -> Path:
-        return TEMP_DIR / f"{self.video_path.stem}_edited.{fmt}"
+        return _temp_dir() / f"{self.video_path.stem}_edited.{fmt}"
 
     def _write_current_subtitle_file(self, fmt: str) -> Path:
         subtitle_path = self._subtitle_export_path(fmt)
         self._sort_segments()
+
+        # Re-exporting an unchanged timeline (format A/B trials, soft vs
+        # burn-in) skips the O(N) rewrite; the hash is recomputed from the
+        # live segments, so any mutation naturally misses the cache.
+        content_hash = hash(tuple((s.start, s.end, s.text) for s in self.segments))
+        if self._subtitle_write_cache.get(fmt) == (content_hash, subtitle_path) and subtitle_path.exists():
+            return subtitle_path
+
         if fmt == "ass":
             write_ass(self.segments, subtitle_path)
         else:
             write_srt(self.segments, subtitle_path)
+        self._subtitle_write_cache[fmt] = (content_hash, subtitle_path)
         return subtitle_path
 
-    def _parse_ffmpeg_progress(self, progress_file: Path) -> float:
-        if not progress_file.exists():
-            return 0.0
+    def _on_export_progress_output(self) -> None:
+        """Parse -progress key=value blocks as ffmpeg writes them to stdout.
+
+        Event-driven via readyReadStandardOutput: no progress temp file,
+        no sampling timer, no bytes read twice. The trailing partial line
+        is carried over so a key split across reads is parsed on the next
+        signal.
+        """
+        process = self._export_proc
+        progress = self._export_progress_dialog
+        if process is None or progress is None:
+            return
 
-        out_time_ms = 0
-        try:
-            lines = progress_file.read_text(encoding="utf-8", errors="ignore").splitlines()
-        except OSError:
-            return 0.0
+        chunk = bytes(process.readAllStandardOutput())
+        if not chunk:
+            return
 
-        for line in lines:
-            if line.startswith("out_time_ms="):
-                try:
-                    out_time_ms = int(line.split("=", 1)[1])
-                except ValueError:
-                    continue
+        data = self._export_progress_tail + chunk
+        cut = data.rfind(b"\n")
+        if cut == -1:
+            self._export_progress_tail = data
+            return
+        self._export_progress_tail = data[cut + 1:]
+
+        # Scan the new block backwards: only the latest value matters.
+        pos = data.rfind(b"out_time_ms=", 0, cut)
+        if pos != -1:
+            end = data.find(b"\n", pos)
+            try:
+                self._export_out_time_ms = int(data[pos + 12:end])
+            except ValueError:
+                pass
+
+        # Duration is frozen at export start; recomputing the max over all
+        # segments on every update is O(N) work for a constant answer.
+        duration = self._export_duration or 0.1
+        percent = max(0.0, min(100.0, (self._export_out_time_ms / 1_000_000) / duration * 100))
+        progress.setValue(int(percent))
 
-        duration = max((seg.end for seg in self.segments), default=0.0)
-        if duration <= 0:
-            duration = max(0.1, self.media_player.duration() / 1000)
+    def export_captioned_video(self) -> None:
+        if self._export_resolve_pending or self._export_proc is not None:
+            return
+        self._export_resolve_pending = True
 
-        return max(0.0, min(100.0, (out_time_ms / 1_000_000) / duration * 100))
+        task = _FfmpegResolveTask()
+        task.signals.resolved.connect(self._on_export_ffmpeg_resolved)
+        self._export_resolve_task = task
+        QThreadPool.globalInstance().start(task)
 
-    def export_captioned_video(self) -> None:
-        ffmpeg_bin, ffmpeg_error = _resolve_ffmpeg_for_subtitle_burnin()
+    def _on_export_ffmpeg_resolved(self, ffmpeg_bin: str | None, ffmpeg_error: str | None) -> None:
+        self._export_resolve_pending = False
+        self._export_resolve_task = None
         if ffmpeg_error is not None:
             QMessageBox.critical(self, "FFmpeg Subtitle Filter Missing", ffmpeg_error)
             return
 
+        self._run_captioned_export(ffmpeg_bin)
+
+    def _run_captioned_export(self, ffmpeg_bin: str) -> None:
         fmt = self.format_combo.currentText().strip().lower()
         subtitle_path = self._write_current_subtitle_file(fmt)
-        output_video_path = OUTPUT_DIR / f"{self.video_path.stem}_captioned_{fmt}.mp4"
-        progress_file = TEMP_DIR / "ffmpeg_export_progress.txt"
-
-        subtitle_filter = f"subtitles=filename={_escape_subtitle_filter_path(subtitle_path)}"
-        command = [
-            ffmpeg_bin,
-            "-y",
-            "-i",
-            str(self.video_path),
-            "-vf",
-            subtitle_filter,
-            "-c:a",
-            "copy",
-            "-progress",
-            str(progress_file),
-            "-nostats",
-            str(output_video_path),
-        ]
+        soft_subs = self.soft_subs_check.isChecked()
+
+        if soft_subs:
+            # Mux the subtitle stream instead of burning it in: stream-copy
+            # finishes in remux time regardless of video length. mp4 needs
+            # the mov_text codec for SRT; ASS keeps its codec in mkv.
+            container = "mkv" if fmt == "ass" else "mp4"
+            output_video_path = _output_dir() / f"{self.video_path.stem}_captioned_{fmt}.{container}"
+            output_video_path.parent.mkdir(parents=True, exist_ok=True)
+            command = (
+                ffmpeg_bin,
+                "-y",
+                "-i",
+                str(self.video_path),
+                "-i",
+                str(subtitle_path),
+                "-map",
+                "0",
+                "-map",
+                "1",
+                "-c",
+                "copy",
+                *(() if fmt == "ass" else ("-c:s", "mov_text")),
+                "-progress",
+                "pipe:1",
+                "-nostats",
+                str(output_video_path),
+            )
+        else:
+            output_video_path = _output_dir() / f"{self.video_path.stem}_captioned_{fmt}.mp4"
+            output_video_path.parent.mkdir(parents=True, exist_ok=True)
+
+            try:
+                caps = _ffmpeg_capabilities(ffmpeg_bin, Path(ffmpeg_bin).stat().st_mtime_ns)
+                hw_input_args, hw_output_args = _hw_encoding_args(caps)
+            except OSError:
+                hw_input_args, hw_output_args = [], []
+
+            subtitle_filter = f"subtitles=filename={_escape_subtitle_filter_path(subtitle_path)}"
+
+            def burnin_command(
+                input_args: tuple[str, ...], output_args: tuple[str, ...]
+            ) -> tuple[str, ...]:
+                return (
+                    ffmpeg_bin,
+                    "-y",
+                    *input_args,
+                    "-i",
+                    str(self.video_path),
+                    "-vf",
+                    subtitle_filter,
+                    *output_args,
+                    "-threads",
+                    "0",
+                    "-c:a",
+                    "copy",
+                    "-progress",
+                    "pipe:1",
+                    "-nostats",
+                    str(output_video_path),
+                )
+
+            # preset/crf are x264 options; hardware encoders reject them
+            # and use their own rate control.
+            software_args = ("-preset", self.preset_combo.currentText(), "-crf", "18")
+            if hw_output_args:
+                command = burnin_command(tuple(hw_input_args), tuple(hw_output_args))
+                # '-encoders' lists everything compiled into the build, so
+                # a hardware encoder can still fail to open at runtime on a
+                # machine without the GPU or driver; keep a software
+                # command ready to retry with.
+                self._export_sw_fallback_command = burnin_command((), software_args)
+            else:
+                command = burnin_command((), software_args)
 
         progress = QProgressDialog("Exporting captioned video...", "Cancel", 0, 100, self)
         progress.setWindowTitle("Export Progress")
+        # Window modality blocks input without a hand-rolled event pump.
         progress.setWindowModality(Qt.WindowModality.WindowModal)
         progress.setValue(0)
 
-        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        # QProcess keeps the encode on the normal event loop: finished
+        # fires when ffmpeg exits and progress arrives over stdout,
+        # instead of the old poll()+processEvents() loop spinning a core.
+        duration = max((seg.end for seg in self.segments), default=0.0)
+        if duration <= 0 and self.media_player is not None:
+            duration = self.media_player.duration() / 1000
+        duration = max(0.1, duration)
+        self._export_duration = duration
+
+        self._export_progress_dialog = progress
+        self._export_output_path = output_video_path
+        self._export_canceled = False
+        progress.canceled.connect(self._cancel_export)
 
-        while process.poll() is None:
-            QApplication.processEvents()
-            if progress.wasCanceled():
-                process.terminate()
-                QMessageBox.warning(self, "Export Cancelled", "Captioned video export was cancelled.")
-                return
+        self._start_export_process(command)
 
-            percent = int(self._parse_ffmpeg_progress(progress_file))
-            progress.setValue(percent)
+    def _start_export_process(self, command: tuple[str, ...]) -> None:
+        process = QProcess(self)
+        self._export_proc = process
+        self._export_command = command
+        self._export_progress_tail = b""
+        self._export_out_time_ms = 0
 
-        stdout, stderr = process.communicate()
-        progress.setValue(100)
+        process.readyReadStandardOutput.connect(self._on_export_progress_output)
+        process.finished.connect(self._on_export_finished)
+        process.errorOccurred.connect(self._on_export_proc_error)
 
-        if process.returncode != 0:
+        process.start(command[0], command[1:])
+
+    def _cancel_export(self) -> None:
+        if self._export_proc is None:
+            return
+        self._export_canceled = True
+        self._export_proc.terminate()
+
+    def _on_export_proc_error(self, error: "QProcess.ProcessError") -> None:
+        # finished never fires for FailedToStart; everything else (crash,
+        # terminate) still reaches _on_export_finished.
+        if error == QProcess.ProcessError.FailedToStart:
+            self._finish_export(failed=True, detail="FFmpeg process failed to start.")
+
+    def _on_export_finished(self, exit_code: int, exit_status: "QProcess.ExitStatus") -> None:
+        process = self._export_proc
+        if process is None:
+            return
+        # stdout now carries the -progress stream, so only stderr is
+        # meaningful for diagnostics.
+        stderr = bytes(process.readAllStandardError()).decode("utf-8", "ignore")
+        failed = exit_code != 0 or exit_status != QProcess.ExitStatus.NormalExit
+
+        fallback = self._export_sw_fallback_command
+        self._export_sw_fallback_command = None
+        if failed and not self._export_canceled and fallback is not None:
+            # The hardware encoder failed to open (typically no GPU or
+            # driver behind a compiled-in encoder); retry once with the
+            # software command before reporting failure.
+            process.deleteLater()
+            if self._export_progress_dialog is not None:
+                self._export_progress_dialog.setValue(0)
+            self._start_export_process(fallback)
+            return
+
+        self._finish_export(failed=failed, detail=stderr.strip())
+
+    def _finish_export(self, *, failed: bool, detail: str) -> None:
+        command = self._export_command
+        output_video_path = self._export_output_path
+        canceled = self._export_canceled
+
+        if self._export_proc is not None:
+            self._export_proc.deleteLater()
+        progress = self._export_progress_dialog
+
+        self._export_proc = None
+        self._export_progress_dialog = None
+        self._export_command = ()
+        self._export_sw_fallback_command = None
+        self._export_output_path = None
+        self._export_canceled = False
+        self._export_progress_tail = b""
+        self._export_out_time_ms = 0
+        self._export_duration = 0.0
+
+        if canceled:
+            if progress is not None:
+                progress.close()
+            QMessageBox.warning(self, "Export Cancelled", "Captioned video export was cancelled.")
+            return
+
+        if failed:
+            if progress is not None:
+                progress.close()
             QMessageBox.critical(
                 self,
                 "Export Failed",
                 "FFmpeg failed while burning captions into the video.\n"
-                f"Command: {' '.join(command)}\n"
-                f"Error: {stderr.strip() or stdout.strip()}",
+                f"Command: {_format_command(command)}\n"
+                f"Error: {detail}",
             )
             return
 
+        if progress is not None:
+            progress.setValue(100)
         QMessageBox.information(
             self,
             "Export Complete",
@@ -1026,19 +1985,21 @@ class CaptionEditorWindow(QMainWindow):
         )
 
     def generate_captions_from_video(self) -> None:
+        if self._generate_proc is not None:
+            return
+
         model_size = self.model_combo.currentText().strip()
         language = self.language_input.text().strip()
 
-        command = [
+        command = (
             sys.executable,
             "-m",
             "backend.main",
             str(self.video_path),
             "--model-size",
             model_size,
-        ]
-        if language:
-            command.extend(["--language", language])
+            *(("--language", language) if language else ()),
+        )
 
         progress = QProgressDialog(
             "Generating captions with Whisper... first run may download model files.",
@@ -1050,26 +2011,86 @@ class CaptionEditorWindow(QMainWindow):
         progress.setWindowTitle("Auto Caption Generation")
         progress.setWindowModality(Qt.WindowModality.WindowModal)
 
-        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        # QProcess drains stderr as it arrives, so Whisper's logging can
+        # never back-pressure the child, and finished replaces the old
+        # poll()+processEvents() spin. The dialog stays indeterminate:
+        # backend.main emits no per-segment progress.
+        process = QProcess(self)
+        process.setStandardOutputFile(QProcess.nullDevice())
+        self._generate_proc = process
+        self._generate_progress_dialog = progress
+        self._generate_command = command
+        self._generate_canceled = False
+        self._generate_stderr = bytearray()
+
+        process.readyReadStandardError.connect(self._drain_generate_stderr)
+        process.finished.connect(self._on_generate_finished)
+        process.errorOccurred.connect(self._on_generate_proc_error)
+        progress.canceled.connect(self._cancel_generation)
+
+        process.start(command[0], command[1:])
+
+    def _drain_generate_stderr(self) -> None:
+        if self._generate_proc is None:
+            return
+        self._generate_stderr += bytes(self._generate_proc.readAllStandardError())
+        # Only the tail matters for error reporting; bound chatty runs.
+        if len(self._generate_stderr) > 65536:
+            del self._generate_stderr[:-32768]
+
+    def _cancel_generation(self) -> None:
+        if self._generate_proc is None:
+            return
+        self._generate_canceled = True
+        self._generate_proc.terminate()
+
+    def _on_generate_proc_error(self, error: "QProcess.ProcessError") -> None:
+        if error == QProcess.ProcessError.FailedToStart:
+            self._finish_generation(failed=True)
+
+    def _on_generate_finished(self, exit_code: int, exit_status: "QProcess.ExitStatus") -> None:
+        failed = exit_code != 0 or exit_status != QProcess.ExitStatus.NormalExit
+        self._finish_generation(failed=failed)
+
+    def _finish_generation(self, *, failed: bool) -> None:
+        process = self._generate_proc
+        if process is None:
+            return
+        self._drain_generate_stderr()
+
+        command = self._generate_command
+        canceled = self._generate_canceled
+        detail = bytes(self._generate_stderr).decode("utf-8", "replace").strip()
+        progress = self._generate_progress_dialog
+
+        self._generate_proc = None
+        self._generate_progress_dialog = None
+        self._generate_command = ()
+        self._generate_canceled = False
+        self._generate_stderr = bytearray()
+        process.deleteLater()
+
+        if progress is not None:
+            progress.close()
 
-        while process.poll() is None:
-            QApplication.processEvents()
-            if progress.wasCanceled():
-                process.terminate()
-                QMessageBox.warning(self, "Cancelled", "Caption generation was cancelled.")
-                return
+        if canceled:
+            QMessageBox.warning(self, "Cancelled", "Caption generation was cancelled.")
+            return
 
-        stdout, stderr = process.communicate()
-        if process.returncode != 0:
+        if failed:
             QMessageBox.critical(
                 self,
                 "Caption Generation Failed",
-                f"Command: {' '.join(command)}\n\n{stderr.strip() or stdout.strip()}",
+                f"Command: {_format_command(command)}\n\n{detail}",
             )
             return
 
-        generated_srt = OUTPUT_DIR / f"{self.video_path.stem}.srt"
-        if not generated_srt.exists():
+        self._load_generated_captions()
+
+    def _load_generated_captions(self) -> None:
+        generated_srt = _output_dir() / f"{self.video_path.stem}.srt"
+        srt_exists, srt_mtime_ns, srt_size = _probe(generated_srt)
+        if not srt_exists:
             QMessageBox.critical(
                 self,
                 "Caption Generation Failed",
@@ -1078,9 +2099,10 @@ class CaptionEditorWindow(QMainWindow):
             return
 
         self.srt_path = generated_srt
-        self.segments = parse_srt_file(generated_srt)
+        self.segments = _cached_parse_srt(generated_srt, (srt_mtime_ns, srt_size))
+        self._srt_loaded_stamp = (str(generated_srt), srt_mtime_ns, srt_size)
         self._sort_segments()
-        self._refresh_timeline_and_list()
+        self._schedule_refresh()
         QMessageBox.information(self, "Captions Ready", f"Generated captions loaded from:\n{generated_srt}")
 
     def sync_lyrics_to_segments(self) -> None:
@@ -1092,23 +2114,59 @@ class CaptionEditorWindow(QMainWindow):
             )
             return
 
+        if self._lyric_sync_task is not None:
+            return
+
         raw_lyrics = self.lyrics_input.toPlainText()
         similarity = self.similarity_spin.value()
 
         try:
             lyrics_lines = parse_lyrics_lines(raw_lyrics)
-            synced_segments = sync_segments_to_lyrics(self.segments, lyrics_lines, min_similarity=similarity)
         except LyricSyncError as exc:
             QMessageBox.warning(self, "Lyrics Sync", str(exc))
             return
 
+        snapshot = [CaptionSegment(start=s.start, end=s.end, text=s.text) for s in self.segments]
+        task = _LyricSyncTask(snapshot, lyrics_lines, similarity)
+        task.signals.finished.connect(self._on_lyric_sync_finished)
+        self._lyric_sync_task = task
+        self._lyric_sync_canceled = False
+
+        dialog = QProgressDialog("Syncing lyrics to captions...", "Cancel", 0, 0, self)
+        dialog.setWindowTitle("Lyrics Sync")
+        dialog.setWindowModality(Qt.WindowModality.WindowModal)
+        dialog.canceled.connect(self._cancel_lyric_sync)
+        self._lyric_sync_dialog = dialog
+
+        QThreadPool.globalInstance().start(task)
+
+    def _cancel_lyric_sync(self) -> None:
+        # The worker cannot be interrupted mid-match; its result is simply
+        # discarded when it arrives.
+        self._lyric_sync_canceled = True
+
+    def _on_lyric_sync_finished(self, synced_segments: object, error: object) -> None:
+        dialog = self._lyric_sync_dialog
+        canceled = self._lyric_sync_canceled
+        self._lyric_sync_task = None
+        self._lyric_sync_dialog = None
+        self._lyric_sync_canceled = False
+
+        if dialog is not None:
+            dialog.close()
+        if canceled:
+            return
+
+        if error is not None:
+            QMessageBox.warning(self, "Lyrics Sync", str(error))
+            return
+
         # Preserve original timeline duration and count; only replace text where sync succeeded.
-        for idx, synced in enumerate(synced_segments):
-            if idx >= len(self.segments):
-                break
-            self.segments[idx].text = synced.text
+        changed = min(len(synced_segments), len(self.segments))
+        for idx in range(changed):
+            self.segments[idx].text = synced_segments[idx].text
 
-        self._refresh_timeline_and_list(self.selected_segment)
+        self._refresh_timeline_and_list(self.selected_segment, dirty_indices=range(changed))
         QMessageBox.information(self, "Lyrics Synced", "Lyrics were synced to your current caption timeline.")
 
 
@@ -1121,26 +2179,26 @@ def parse_args() -> argparse.Namespace:
 
 def _resolve_launch_video(args: argparse.Namespace) -> Path | None:
     if args.video is not None:
-        return args.video.resolve()
+        return Path(os.path.abspath(args.video))
 
     path_str, _ = QFileDialog.getOpenFileName(
         None,
         "Select Video",
-        str(PROJECT_ROOT),
+        str(_project_root()),
         "Video Files (*.mp4 *.mov *.mkv *.avi *.m4v *.webm)",
     )
     if not path_str:
         return None
-    return Path(path_str).resolve()
+    return Path(os.path.abspath(path_str))
 
 
 def _resolve_launch_srt(video_path: Path, args: argparse.Namespace) -> Path | None:
     if args.srt is not None:
-        return args.srt.resolve()
+        return Path(os.path.abspath(args.srt))
 
-    generated = OUTPUT_DIR / f"{video_path.stem}.srt"
-    if generated.exists():
-        return generated.resolve()
+    generated = _output_dir() / f"{video_path.stem}.srt"
+    if _probe(generated)[0]:
+        return generated
 
     return None
 
@@ -1148,12 +2206,12 @@ def _resolve_launch_srt(video_path: Path, args: argparse.Namespace) -> Path | No
 def run() -> None:
     args = parse_args()
 
+    # Must run before QApplication/QtMultimedia initialize so the plugin
+    # path and media backend variables take effect.
+    _configure_qt_runtime_environment()
+
     app = QApplication(sys.argv)
     app.setFont(QFont("Helvetica Neue"))
-    backend_error = _validate_multimedia_backend()
-    if backend_error is not None:
-        QMessageBox.critical(None, "Qt Multimedia Backend Error", backend_error)
-        raise SystemExit(backend_error)
 
     video_path = _resolve_launch_video(args)
     if video_path is None:
@@ -1167,6 +2225,15 @@ def run() -> None:
         raise SystemExit(f"SRT file not found: {srt_path}")
 
     window = CaptionEditorWindow(video_path, srt_path)
+
+    # Validate the media backend concurrently with first paint instead of
+    # blocking startup on it; a bad backend is reported as soon as the
+    # probe returns.
+    probe = _BackendProbeTask()
+    probe.signals.finished.connect(window.report_backend_error)
+    window._backend_probe_task = probe
+    QThreadPool.globalInstance().start(probe)
+
     window.show()
     sys.exit(app.exec())
 
@@ -2,7 +2,10 @@ from __future__ import annotations
 
 import shutil
 import subprocess
+import threading
+from collections import deque
 from pathlib import Path
+from typing import IO
 
 
 class AudioExtractionError(RuntimeError):
@@ -21,6 +24,13 @@ def ensure_ffmpeg_available() -> None:
         )
 
 
+def _drain_stderr(stream: IO[str], tail: deque[str]) -> None:
+    # Reading line by line into a bounded deque keeps memory flat no
+    # matter how chatty ffmpeg gets; only the tail matters for errors.
+    for line in stream:
+        tail.append(line.rstrip("\n"))
+
+
 def extract_audio(video_path: Path, audio_path: Path, sample_rate: int = 16000) -> Path:
     """Extract mono WAV audio from a video file using FFmpeg."""
     ensure_ffmpeg_available()
@@ -33,6 +43,9 @@ def extract_audio(video_path: Path, audio_path: Path, sample_rate: int = 16000)
     command = [
         "ffmpeg",
         "-y",
+        "-nostats",
+        "-loglevel",
+        "error",
         "-i",
         str(video_path),
         "-vn",
@@ -45,12 +58,30 @@ def extract_audio(video_path: Path, audio_path: Path, sample_rate: int = 16000)
         str(audio_path),
     ]
 
-    result = subprocess.run(command, capture_output=True, text=True)
-    if result.returncode != 0:
+    # capture_output buffers everything ffmpeg prints; on long inputs that
+    # is megabytes of text nobody reads on success. Drain stderr into a
+    # bounded ring buffer instead and discard stdout entirely.
+    stderr_tail: deque[str] = deque(maxlen=512)
+    process = subprocess.Popen(
+        command,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    assert process.stderr is not None
+    drainer = threading.Thread(
+        target=_drain_stderr, args=(process.stderr, stderr_tail), daemon=True
+    )
+    drainer.start()
+    returncode = process.wait()
+    drainer.join()
+
+    if returncode != 0:
+        detail = "\n".join(stderr_tail).strip()
         raise AudioExtractionError(
             "FFmpeg failed while extracting audio.\n"
             f"Command: {' '.join(command)}\n"
-            f"Error: {result.stderr.strip()}"
+            f"Error: {detail}"
         )
 
     return audio_path
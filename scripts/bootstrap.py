@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import os
 import platform
 import shlex
@@ -53,8 +54,50 @@ def _create_venv() -> Path:
     return python_bin
 
 
+_MIN_PIP_VERSION = (23, 0)
+
+
+def _pip_needs_upgrade(python_bin: Path) -> bool:
+    result = _run_capture([str(python_bin), "-m", "pip", "--version"])
+    # Output form: "pip 23.2.1 from ..."; upgrade on anything unparsable.
+    try:
+        version = tuple(int(part) for part in result.stdout.split()[1].split(".")[:2])
+    except (IndexError, ValueError):
+        return True
+    return version < _MIN_PIP_VERSION
+
+
+def _pip_needs_install(python_bin: Path) -> bool:
+    # A dry-run resolve costs seconds; actually installing the pin set
+    # costs tens. Anything unexpected falls through to a real install.
+    result = _run_capture(
+        [
+            str(python_bin),
+            "-m",
+            "pip",
+            "install",
+            "--dry-run",
+            "--prefer-binary",
+            "-r",
+            str(ROOT_DIR / "requirements.txt"),
+        ]
+    )
+    if result.returncode != 0:
+        return True
+    return "Would install" in result.stdout
+
+
 def _install_python_dependencies(python_bin: Path) -> None:
-    _run([str(python_bin), "-m", "pip", "install", "--upgrade", "pip", "setuptools", "wheel"])
+    if _pip_needs_upgrade(python_bin):
+        _run([str(python_bin), "-m", "pip", "install", "--upgrade", "pip", "setuptools", "wheel"])
+
+    if not _pip_needs_install(python_bin):
+        print("Python dependencies already satisfied; skipping install.")
+        return
+
+    # No --force-reinstall: pinned requirements that are already satisfied
+    # resolve from pip's wheel cache instead of re-downloading and
+    # re-installing every wheel, which dominated bootstrap time on reruns.
     _run(
         [
             str(python_bin),
@@ -62,14 +105,29 @@ def _install_python_dependencies(python_bin: Path) -> None:
             "pip",
             "install",
             "--upgrade",
-            "--force-reinstall",
+            "--prefer-binary",
             "-r",
             str(ROOT_DIR / "requirements.txt"),
         ]
     )
 
 
+def _precompile_bytecode(python_bin: Path) -> None:
+    # Without this, every .py compiles lazily on first import, which lands
+    # in the app's cold start. -j 0 compiles on all cores. check=False:
+    # a broken file in a vendored package should not abort bootstrap.
+    _run(
+        [str(python_bin), "-m", "compileall", "-q", "-j", "0", str(ROOT_DIR / "backend")],
+        check=False,
+    )
+    _run([str(python_bin), "-m", "compileall", "-q", "-j", "0", str(VENV_DIR)], check=False)
+
+
+@functools.lru_cache(maxsize=None)
 def _ffmpeg_has_subtitles_filter(ffmpeg_bin: str) -> bool:
+    # Memoized per real path: forking ffmpeg for its filter table is the
+    # slowest step of resolution and _resolve_ffmpeg runs twice when an
+    # auto-install happens in between.
     result = _run_capture([ffmpeg_bin, "-hide_banner", "-filters"])
     output = f"{result.stdout}\n{result.stderr}"
     for line in output.splitlines():
@@ -138,13 +196,21 @@ def _resolve_ffmpeg(with_export_support: bool) -> str | None:
             ]
         )
 
+    # Dedupe by real path so brew-style symlink farms don't probe the
+    # same binary once per alias.
     deduped: list[str] = []
+    seen_real: set[str] = set()
     for candidate in candidates:
-        if candidate not in deduped and Path(candidate).exists():
-            deduped.append(candidate)
+        if not Path(candidate).exists():
+            continue
+        real = os.path.realpath(candidate)
+        if real in seen_real:
+            continue
+        seen_real.add(real)
+        deduped.append(candidate)
 
     for ffmpeg_bin in deduped:
-        if not with_export_support or _ffmpeg_has_subtitles_filter(ffmpeg_bin):
+        if not with_export_support or _ffmpeg_has_subtitles_filter(os.path.realpath(ffmpeg_bin)):
             return ffmpeg_bin
 
     return None
@@ -197,6 +263,7 @@ def main() -> None:
     _validate_python()
     python_bin = _create_venv()
     _install_python_dependencies(python_bin)
+    _precompile_bytecode(python_bin)
 
     ffmpeg_bin = None
     if not args.skip_ffmpeg: